@@ -30,6 +30,11 @@ impl Available {
             .collect()
     }
 
+    /// Number of selected cards, without collecting them
+    pub fn selected_len(&self) -> usize {
+        self.cards.iter().filter(|(_, s)| *s).count()
+    }
+
     pub fn not_selected(&self) -> Vec<Card> {
         self.cards
             .iter()
@@ -46,7 +51,7 @@ impl Available {
     }
 
     pub(crate) fn remove_selected(&mut self) -> usize {
-        let remove_count = self.selected().len();
+        let remove_count = self.selected_len();
         self.cards.retain(|(_c, a)| !*a);
         remove_count
     }
@@ -79,7 +84,7 @@ impl Available {
     }
 
     pub(crate) fn empty(&mut self) {
-        self.cards = Vec::new();
+        self.cards.clear();
     }
 
     pub(crate) fn extend(&mut self, cards: Vec<Card>) {
@@ -92,6 +97,14 @@ impl Available {
         self.cards.iter().map(|(c, _)| *c).collect()
     }
 
+    pub fn len(&self) -> usize {
+        self.cards.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.cards.is_empty()
+    }
+
     pub(crate) fn cards_and_selected(&self) -> Vec<(Card, bool)> {
         self.cards.clone()
     }
@@ -109,9 +122,12 @@ mod tests {
         let mut a = Available::default();
         a.extend(vec![ace, king]);
         assert_eq!(a.selected().len(), 0);
+        assert_eq!(a.selected_len(), 0);
+        assert_eq!(a.len(), 2);
 
         a.select_card(ace).unwrap();
         assert_eq!(a.selected().len(), 1);
+        assert_eq!(a.selected_len(), 1);
 
         let selected = a.selected();
         assert_eq!(selected[0], ace);
@@ -1,7 +1,7 @@
 #[cfg(feature = "colored")]
 use colored::Colorize;
 #[cfg(feature = "python")]
-use pyo3::pyclass;
+use pyo3::{pyclass, pymethods};
 use std::{
     fmt,
     sync::atomic::{AtomicUsize, Ordering},
@@ -211,6 +211,20 @@ impl Card {
     }
 }
 
+#[cfg(feature = "python")]
+#[pymethods]
+impl Card {
+    #[getter(value)]
+    fn py_value(&self) -> Value {
+        self.value
+    }
+
+    #[getter(suit)]
+    fn py_suit(&self) -> Suit {
+        self.suit
+    }
+}
+
 impl fmt::Debug for Card {
     fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
         #[cfg(feature = "colored")]
@@ -17,10 +17,14 @@ impl Deck {
         }
         Some(self.cards.drain(0..n).collect())
     }
-    pub(crate) fn len(&self) -> usize {
+    pub fn len(&self) -> usize {
         self.cards.len()
     }
 
+    pub fn is_empty(&self) -> bool {
+        self.cards.is_empty()
+    }
+
     pub(crate) fn shuffle(&mut self) {
         self.cards.shuffle(&mut thread_rng());
     }
@@ -37,6 +41,16 @@ impl Deck {
         self.cards.clone()
     }
 
+    /// Refill with the standard 52 cards, reusing the deck's allocation
+    pub(crate) fn reset(&mut self) {
+        self.cards.clear();
+        for v in &Value::values() {
+            for s in &Suit::suits() {
+                self.cards.push(Card::new(*v, *s));
+            }
+        }
+    }
+
     // // Loops through cards, assigning index to each equal to index in deck
     // pub(crate) fn index_cards(&mut self) {
     //     let mut i = 0;
@@ -49,13 +63,8 @@ impl Deck {
 
 impl Default for Deck {
     fn default() -> Self {
-        let mut cards: Vec<Card> = Vec::new();
-        for v in &Value::values() {
-            for s in &Suit::suits() {
-                let c = Card::new(*v, *s);
-                cards.push(c);
-            }
-        }
-        Self { cards }
+        let mut deck = Self::new();
+        deck.reset();
+        deck
     }
 }
@@ -1198,6 +1198,9 @@ impl Game {
     }
 
     /// Reset the game to its initial state, clearing all jokers and their state.
+    /// The jokers, history, deck and card buffers are cleared in place so a
+    /// game can be reused across episodes. The shop, vouchers and boss blind
+    /// state are rebuilt from scratch.
     pub fn reset_game(&mut self) {
         // Clear all jokers
         self.jokers.clear();
@@ -1220,9 +1223,21 @@ impl Game {
         self.discarded.clear();
 
         // Reset deck and available cards
-        self.deck = crate::deck::Deck::default();
-        self.available = crate::available::Available::default();
+        self.deck.reset();
+        self.available.empty();
         self.blind = None;
+
+        // Reset shop, consumables and the rest of the extended state so a
+        // reset game is equivalent to a freshly constructed one
+        self.shop = Shop::new();
+        self.reward = self.config.reward_base as f64;
+        self.consumables_in_hand.clear();
+        self.vouchers = VoucherCollection::new();
+        self.boss_blind_state = BossBlindState::new();
+        self.pack_inventory.clear();
+        self.open_pack = None;
+        self.joker_effect_processor.clear_cache();
+        self.debug_messages.clear();
     }
 }
 
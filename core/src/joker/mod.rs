@@ -4,16 +4,21 @@ use crate::joker_state::{JokerState, JokerStateManager};
 use crate::rank::HandRank;
 use crate::stage::Stage;
 #[cfg(feature = "python")]
-use pyo3::{pyclass, pymethods};
+use pyo3::exceptions::PyTypeError;
+#[cfg(feature = "python")]
+use pyo3::pyclass::CompareOp;
+#[cfg(feature = "python")]
+use pyo3::{pyclass, pymethods, PyResult};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::HashMap;
 use std::fmt;
 use std::sync::Arc;
+use strum::IntoStaticStr;
 
 /// Enum representing all 150 joker identifiers
-#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
-#[cfg_attr(feature = "python", pyclass(eq))]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize, IntoStaticStr)]
+#[cfg_attr(feature = "python", pyclass(frozen))]
 pub enum JokerId {
     // Basic scoring jokers (Common)
     Joker,
@@ -191,9 +196,46 @@ pub enum JokerId {
     Reserved10,
 }
 
+impl JokerId {
+    /// The variant name, e.g. `"GreedyJoker"`, without formatting
+    pub fn name(&self) -> &'static str {
+        self.into()
+    }
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl JokerId {
+    /// Name of the joker id, e.g. `JokerId.GreedyJoker.name == "GreedyJoker"`
+    #[getter(name)]
+    fn py_name(&self) -> &'static str {
+        self.into()
+    }
+
+    // Equality and hashing work on the discriminant directly, rather than
+    // through the derived PartialEq/Hash that #[pyclass(eq, hash)] uses
+    fn __richcmp__(&self, other: &Self, op: CompareOp) -> PyResult<bool> {
+        let (lhs, rhs) = (*self as u16, *other as u16);
+        match op {
+            CompareOp::Eq => Ok(lhs == rhs),
+            CompareOp::Ne => Ok(lhs != rhs),
+            _ => Err(PyTypeError::new_err("JokerId only supports == and !=")),
+        }
+    }
+
+    fn __hash__(&self) -> u64 {
+        *self as u64
+    }
+
+    /// The discriminant, the same value stored in `GameState.joker_id_codes`
+    fn __int__(&self) -> u16 {
+        *self as u16
+    }
+}
+
 /// Joker rarity levels
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
-#[cfg_attr(feature = "python", pyclass(eq))]
+#[cfg_attr(feature = "python", pyclass(eq, eq_int))]
 pub enum JokerRarity {
     Common,
     Uncommon,
@@ -201,17 +243,24 @@ pub enum JokerRarity {
     Legendary,
 }
 
-impl fmt::Display for JokerRarity {
-    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+impl JokerRarity {
+    /// The rarity's name, as a static string
+    pub fn name(&self) -> &'static str {
         match self {
-            Self::Common => write!(f, "Common"),
-            Self::Uncommon => write!(f, "Uncommon"),
-            Self::Rare => write!(f, "Rare"),
-            Self::Legendary => write!(f, "Legendary"),
+            Self::Common => "Common",
+            Self::Uncommon => "Uncommon",
+            Self::Rare => "Rare",
+            Self::Legendary => "Legendary",
         }
     }
 }
 
+impl fmt::Display for JokerRarity {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str(self.name())
+    }
+}
+
 /// Effect that a joker can apply to modify game state.
 ///
 /// `JokerEffect` represents the comprehensive impact a joker can have on the game
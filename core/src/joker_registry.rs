@@ -16,8 +16,11 @@ pub fn calculate_joker_cost(rarity: JokerRarity) -> i32 {
 }
 
 /// Definition of a joker's metadata and properties
+///
+/// Frozen on the Python side: definitions are read-only, so attribute reads
+/// skip the runtime borrow check
 #[derive(Debug, Clone)]
-#[cfg_attr(feature = "python", pyclass)]
+#[cfg_attr(feature = "python", pyclass(frozen))]
 pub struct JokerDefinition {
     pub id: JokerId,
     pub name: String,
@@ -56,15 +59,15 @@ impl JokerDefinition {
     /// Get the joker name
     #[cfg(feature = "python")]
     #[getter]
-    fn name(&self) -> String {
-        self.name.clone()
+    fn name(&self) -> &str {
+        &self.name
     }
 
     /// Get the joker description
     #[cfg(feature = "python")]
     #[getter]
-    fn description(&self) -> String {
-        self.description.clone()
+    fn description(&self) -> &str {
+        &self.description
     }
 
     /// Get the joker rarity
@@ -63,6 +63,11 @@ impl JokerState {
         }
     }
 
+    /// Triggers remaining as a plain integer, -1 for unlimited
+    pub fn triggers_remaining_raw(&self) -> i32 {
+        self.triggers_remaining.map_or(-1, |count| count as i32)
+    }
+
     /// Check if triggers are available
     pub fn has_triggers(&self) -> bool {
         match self.triggers_remaining {
@@ -128,6 +133,21 @@ impl JokerStateManager {
         }
     }
 
+    /// Borrow all joker states under a single read lock
+    ///
+    /// Unlike `get_state`, nothing is cloned: `f` sees the states in place,
+    /// which suits read-only snapshots over many jokers.
+    /// Returns `None` if the lock is poisoned.
+    pub fn with_states<R>(&self, f: impl FnOnce(&HashMap<JokerId, JokerState>) -> R) -> Option<R> {
+        match self.states.read() {
+            Ok(states) => Some(f(&states)),
+            Err(_) => {
+                eprintln!("Warning: Joker state mutex poisoned, cannot read joker states");
+                None
+            }
+        }
+    }
+
     /// Get a copy of a joker's state or create default if not exists
     pub fn get_or_default(&self, joker_id: JokerId) -> JokerState {
         self.get_state(joker_id).unwrap_or_default()
@@ -1190,6 +1210,13 @@ mod tests {
         assert!(!state.use_trigger());
     }
 
+    #[test]
+    fn test_triggers_remaining_raw() {
+        assert_eq!(JokerState::new().triggers_remaining_raw(), -1);
+        assert_eq!(JokerState::with_triggers(3).triggers_remaining_raw(), 3);
+        assert_eq!(JokerState::with_triggers(0).triggers_remaining_raw(), 0);
+    }
+
     #[test]
     fn test_accumulated_value() {
         let mut state = JokerState::new();
@@ -178,9 +178,8 @@ impl ActionSpace {
     }
 
     pub fn to_action(&self, index: usize, game: &Game) -> Result<Action, ActionSpaceError> {
-        let vec = self.to_vec();
-        if let Some(v) = vec.get(index) {
-            if *v == 0 {
+        if let Some(v) = self.iter().nth(index) {
+            if v == 0 {
                 return Err(ActionSpaceError::MaskedAction);
             }
         } else {
@@ -247,25 +246,33 @@ impl ActionSpace {
         }
     }
 
-    pub fn to_vec(&self) -> Vec<usize> {
+    // Mask segments in action index order, borrowed rather than cloned
+    fn segments(&self) -> [&[usize]; 9] {
         [
-            self.select_card.clone(),
-            self.move_card_left.clone(),
-            self.move_card_right.clone(),
-            self.play.clone(),
-            self.discard.clone(),
-            self.cash_out.clone(),
-            self.buy_joker.clone(),
-            self.next_round.clone(),
-            self.select_blind.clone(),
+            &self.select_card,
+            &self.move_card_left,
+            &self.move_card_right,
+            &self.play,
+            &self.discard,
+            &self.cash_out,
+            &self.buy_joker,
+            &self.next_round,
+            &self.select_blind,
         ]
-        .concat()
+    }
+
+    /// Iterate the mask in action index order without building a vec
+    pub fn iter(&self) -> impl Iterator<Item = usize> + '_ {
+        self.segments().into_iter().flatten().copied()
+    }
+
+    pub fn to_vec(&self) -> Vec<usize> {
+        self.segments().concat()
     }
 
     // True is all elements are masked
     pub fn is_empty(&self) -> bool {
-        let vec = self.to_vec();
-        (*vec.iter().min().unwrap() == 0) && (*vec.iter().max().unwrap() == 0)
+        self.iter().all(|v| v == 0)
     }
 }
 
@@ -338,6 +345,20 @@ mod tests {
         assert!(res.is_err());
     }
 
+    #[test]
+    fn test_iter_matches_to_vec() {
+        let c = Config::default();
+        let mut a = ActionSpace::from(c);
+        assert!(a.is_empty());
+
+        a.unmask_select_card(3).unwrap();
+        a.unmask_play();
+
+        assert_eq!(a.iter().collect::<Vec<_>>(), a.to_vec());
+        assert_eq!(a.iter().count(), a.size());
+        assert!(!a.is_empty());
+    }
+
     #[test]
     fn test_index_to_action() {
         let mut g = Game::default();
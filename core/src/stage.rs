@@ -78,7 +78,7 @@ impl Stage {
 #[cfg(feature = "python")]
 #[pymethods]
 impl Stage {
-    fn int(&self) -> usize {
+    pub fn int(&self) -> usize {
         match self {
             Self::PreBlind() => 0,
             Self::Blind(blind) => match blind {
@@ -158,6 +158,29 @@ fn test_reset_game_cleans_joker_state() {
         .is_none());
 }
 
+#[test]
+fn test_reset_game_matches_new_game() {
+    // Test that a reset game can be reused in place of a fresh one
+    let mut game = Game::new(Config::default());
+    let fresh = Game::new(Config::default());
+
+    game.money = 123.0;
+    game.reward = 42.0;
+    game.score = 1000.0;
+    game.debug_messages.push("message".to_string());
+
+    game.reset_game();
+
+    assert_eq!(game.money, fresh.money);
+    assert_eq!(game.reward, fresh.reward);
+    assert_eq!(game.score, fresh.score);
+    assert_eq!(game.stage, fresh.stage);
+    assert_eq!(game.deck.cards().len(), fresh.deck.cards().len());
+    assert!(game.debug_messages.is_empty());
+    assert!(game.pack_inventory.is_empty());
+    assert!(game.open_pack.is_none());
+}
+
 #[test]
 fn test_joker_state_integration_during_blind() {
     // Test that joker state persists and updates correctly during blind play
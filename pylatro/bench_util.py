@@ -0,0 +1,41 @@
+"""
+Timing helpers shared by the performance scripts.
+"""
+
+import time
+import timeit
+import warnings
+from collections import namedtuple
+
+# cold_ns: the first call on its own, warm_ns: best per-call time of the warm
+# runs, number: calls per warm run
+BenchResult = namedtuple("BenchResult", ["cold_ns", "warm_ns", "number"])
+
+
+def bench(body, repeat=5):
+    """Time body() and return a BenchResult.
+
+    The first call is timed alone since PyO3's first-call paths differ from
+    the warm ones. The calls per run are then picked with Timer.autorange and
+    the best of `repeat` runs is kept, the fastest run is the one least
+    disturbed by GC pauses and OS jitter. Deprecation warnings are ignored
+    while timing, they would otherwise pile up under pytest's recorder.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        start = time.perf_counter_ns()
+        body()
+        cold_ns = time.perf_counter_ns() - start
+
+        timer = timeit.Timer(body)
+        number, _ = timer.autorange()
+        warm_ns = min(timer.repeat(repeat, number)) / number * 1e9
+    return BenchResult(cold_ns, warm_ns, number)
+
+
+def format_result(result):
+    """One line summary of a BenchResult."""
+    return (
+        f"{result.warm_ns / 1000:.2f}us/call warm ({result.number} calls/run), "
+        f"{result.cold_ns / 1000:.2f}us cold"
+    )
@@ -1,60 +1,69 @@
 import pylatro
 import random
+from itertools import compress
 
 
-def run_game() -> (bool, int):
+def new_config() -> pylatro.Config:
     config = pylatro.Config()
     config.ante_end = 1
-    game = pylatro.GameEngine(config)
-
-    # Run the game
-    action_space_loop(game)
-    # action_loop(game)
+    return config
 
-    if game.is_win:
-        print("game win!")
-        print(game.state)
-        # print(game.state.action_history)
 
-    return game.is_win, game.state.score
+def run_game() -> (bool, int):
+    # The whole random playout runs inside the engine, use
+    # action_space_loop/action_loop below to drive a game from python.
+    return pylatro.random_rollout(new_config())
 
 
 # Use dynamic action api (dynamic sized list)
 # FIXED: Changed parameter type from GameState to GameEngine
 def action_loop(game: pylatro.GameEngine):
+    # Bind the hot methods once instead of resolving them every iteration
+    choice = random.choice
+    gen_actions = game.gen_actions
+    handle_action = game.handle_action
     while True:
         # FIXED: Use GameEngine.is_over instead of GameState.is_over
         if game.is_over:
             break
         # FIXED: Use GameEngine.gen_actions() instead of GameState.gen_actions()
-        actions = game.gen_actions()
+        actions = gen_actions()
         if len(actions) > 0:
-            action = random.choice(actions)
+            action = choice(actions)
             # FIXED: Use GameEngine.handle_action() instead of GameState.handle_action()
-            game.handle_action(action)
+            handle_action(action)
 
 
 # Use action space api (static/bounded list)
 # FIXED: Changed parameter type from GameState to GameEngine
 def action_space_loop(game: pylatro.GameEngine):
+    # Bind the hot methods once instead of resolving them every iteration
+    choice = random.choice
+    gen_action_space = game.gen_action_space_bytes
+    handle_action_index = game.handle_action_index
+    # The action space has a fixed length for a given config, build the
+    # index range once and filter it by the mask in C with compress
+    indices = range(len(gen_action_space()))
+    # The loop below learns the game ended from handle_action_index, so
+    # is_over is only checked once up front
+    if game.is_over:
+        return
     while True:
-        # FIXED: Use GameEngine.is_over instead of GameState.is_over
-        if game.is_over:
-            return
         # FIXED: Use GameEngine.gen_action_space() instead of GameState.gen_action_space()
-        space = game.gen_action_space()
-        while True:
-            if 1 not in set(space):
-                # for debugging, this shouldn't happened
-                print("empty action space")
-                # FIXED: Removed redundant .state access since game is now GameEngine
-                print(game.state)
-                return
-            index = random.choice(range(len(space)))
-            if space[index] == 1:
-                # FIXED: Use GameEngine.handle_action_index() instead of GameState.handle_action_index()
-                game.handle_action_index(index)
-                break
+        space = gen_action_space()
+        # Sample uniformly from the legal indices in one pass instead of
+        # rejection-sampling the whole space
+        legal = list(compress(indices, space))
+        if not legal:
+            # for debugging, this shouldn't happened
+            print("empty action space")
+            # FIXED: Removed redundant .state access since game is now GameEngine
+            print(game.state)
+            return
+        # FIXED: Use GameEngine.handle_action_index() instead of GameState.handle_action_index()
+        # handle_action_index reports whether the game ended
+        if handle_action_index(choice(legal)):
+            return
 
 
 # ================================================================
@@ -84,13 +93,11 @@ def deprecated_action_loop_demo():
 
 
 def main():
-    high_score = 0
-    for i in range(100_000):
-        # print(f"running game {i}")
-        win, score = run_game()
-        if score > high_score:
-            high_score = score
-            print(f"new high score: {high_score} (game #{i})")
+    # Games are independent, so fan them out over every core
+    wins, scores = pylatro.parallel_rollouts(new_config(), 100_000)
+    high_score = max(scores)
+    print(f"high score: {high_score} (game #{scores.index(high_score)})")
+    print(f"wins: {sum(wins)}/{len(wins)}")
 
 
 if __name__ == "__main__":
@@ -3,10 +3,13 @@ from gymnasium import spaces
 import pylatro
 from typing import Optional
 import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class BalatroEnv(gym.Env):
-    def __init__(self):
+    def __init__(self, max_episodes: int = 100_000):
         super(BalatroEnv, self).__init__()
 
         config = pylatro.Config()
@@ -17,44 +20,49 @@ class BalatroEnv(gym.Env):
         self._score = 0
         self._last_score = 0
         self._target_score = 0
-        self._high_score = 0
+        # Legal-action mask for the current state, rebuilt lazily after the
+        # state changes (see action_mask)
+        self._mask = None
 
         self.action_space = spaces.Discrete(len(self._game.gen_action_space()))
-        self.observation_space = gym.spaces.Dict(
-            {
-                "score": gym.spaces.Discrete(100_000),
-                "target": gym.spaces.Discrete(100_000),
-                "stage": gym.spaces.Discrete(config.stage_max + 1),
-                "round": gym.spaces.Discrete(config.ante_end + 1),
-                "plays": gym.spaces.Discrete(config.plays + 1),
-                "discards": gym.spaces.Discrete(config.discards + 1),
-                "money": gym.spaces.Discrete(config.money_max + 1),
-                "deck_len": gym.spaces.Discrete(config.deck_max + 1),
-                "selected_len": gym.spaces.Discrete(config.selected_max + 1),
-                "available_len": gym.spaces.Discrete(config.available_max + 1),
-                "discarded_len": gym.spaces.Discrete(config.discarded_max + 1),
-                "jokers_len": gym.spaces.Discrete(config.joker_slots_max + 1),
-            }
+        # Observation layout: score, target, stage, round, plays, discards,
+        # money, deck_len, selected_len, available_len, discarded_len, jokers_len
+        self.observation_space = gym.spaces.MultiDiscrete(
+            [
+                100_000,
+                100_000,
+                config.stage_max + 1,
+                config.ante_end + 1,
+                config.plays + 1,
+                config.discards + 1,
+                config.money_max + 1,
+                config.deck_max + 1,
+                config.selected_max + 1,
+                config.available_max + 1,
+                config.discarded_max + 1,
+                config.joker_slots_max + 1,
+            ]
         )
+        # Observations are written into two preallocated buffers used in
+        # turn, so the previous observation stays valid while the next one is
+        # being filled (the training loop holds both for the q update)
+        self._obs_bufs = np.zeros((2, 12), dtype=np.int64)
+        self._obs_i = 0
         self.score_queue = []
         self.actions_queue = []
+        # Per-episode return and length, written straight into preallocated
+        # arrays (episodes past max_episodes are not recorded)
+        self.return_buf = np.zeros(max_episodes, dtype=np.float32)
+        self.length_buf = np.zeros(max_episodes, dtype=np.int32)
+        self.episode_count = 0
+        self._ep_reward = 0.0
+        self._ep_len = 0
 
     def _get_obs(self):
-        state = self._game.state
-        obs = {
-            "score": self._score,
-            "target": self._target_score,
-            "stage": state.stage.int(),
-            "round": state.round,
-            "plays": state.plays,
-            "discards": state.discards,
-            "money": state.money,
-            "deck_len": len(state.deck),
-            "selected_len": len(state.selected),
-            "available_len": len(state.available),
-            "discarded_len": len(state.discarded),
-            "jokers_len": len(state.jokers),
-        }
+        self._obs_i ^= 1
+        obs = self._obs_bufs[self._obs_i]
+        # The engine builds the whole vector in one call
+        obs[:] = self._game.obs_vector()
         return obs
 
     def _get_info(self):
@@ -62,23 +70,22 @@ class BalatroEnv(gym.Env):
 
     def step(self, index):
         legal = False
-        space = self._game.gen_action_space()
+        # Reuse the mask the agent already fetched for this state
+        space = self.action_mask()
         # Action must be legal
         if space[index] == 1:
             legal = True
-            self._game.handle_action_index(index)
+            terminated = self._game.handle_action_index(index)
+            self._mask = None
+        else:
+            terminated = self._game.is_over
 
-        terminated = self._game.is_over
         truncated = terminated
 
+        observation = self._get_obs()
         self._last_score = self._score
-        self._score = self._game.state.score
-        self._target_score = self._game.state.required_score
-
-        if self._score > self._high_score:
-            self._high_score = self._score
-            # print(f"new high score: {score}")
-            # print(f"win: {self._game.is_win}")
+        self._score = int(observation[0])
+        self._target_score = int(observation[1])
 
         reward = 0
         score_diff = self._score - self._last_score
@@ -94,20 +101,29 @@ class BalatroEnv(gym.Env):
             self.score_queue.append(self._score)
         if not legal:
             reward = -10
-            print("illegal")
-            print(index)
-            print(self.action_mask())
+            logger.debug("illegal action %d, mask: %s", index, space)
+
+        self._ep_reward += reward
+        self._ep_len += 1
+        if terminated:
+            if self.episode_count < self.return_buf.size:
+                self.return_buf[self.episode_count] = self._ep_reward
+                self.length_buf[self.episode_count] = self._ep_len
+            self.episode_count += 1
 
-        observation = self._get_obs()
         info = self._get_info()
         return observation, reward, terminated, truncated, info
 
     def reset(self, seed: Optional[int] = None, options: Optional[dict] = None):
         super().reset(seed=seed)
-        self._game = pylatro.GameEngine(self._config)
+        # Reuse the engine rather than allocating a new game per episode
+        self._game.reset()
+        self._mask = None
         self._score = 0
         self._last_score = 0
         self._target_score = 0
+        self._ep_reward = 0.0
+        self._ep_len = 0
         observation = self._get_obs()
         info = self._get_info()
 
@@ -117,8 +133,12 @@ class BalatroEnv(gym.Env):
         return
 
     def action_mask(self):
-        mask = np.asarray(self._game.gen_action_space(), dtype=np.int8)
-        return mask
+        if self._mask is None:
+            # View the engine's byte mask directly rather than converting a list
+            self._mask = np.frombuffer(
+                self._game.gen_action_space_bytes(), dtype=np.int8
+            )
+        return self._mask
 
 
 def register():
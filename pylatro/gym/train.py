@@ -5,6 +5,42 @@ import numpy as np
 from env import register
 from tqdm import tqdm
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain python
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+# number of random draws generated per refill of the agent's buffer
+RAND_BLOCK = 4096
+
+
+@njit(cache=True)
+def _td_update(q_row, next_q_row, action, reward, terminated, lr, gamma):
+    """Apply one Q-learning update to q_row in place and return the TD error."""
+    future_q_value = 0.0 if terminated else next_q_row.max()
+    temporal_difference = reward + gamma * future_q_value - q_row[action]
+    q_row[action] += lr * temporal_difference
+    return temporal_difference
+
+
+@njit(cache=True, nogil=True)
+def _pick_legal(mask, r):
+    """Return the legal index at fraction r in [0, 1) of the legal actions.
+
+    Falls back to action 0 when the mask has no legal actions, as
+    gymnasium's masked sampling does.
+    """
+    legal = np.flatnonzero(mask)
+    if legal.size == 0:
+        return 0
+    return legal[int(r * legal.size)]
+
 
 class BalatroAgent:
     def __init__(
@@ -15,6 +51,7 @@ class BalatroAgent:
         epsilon_decay: float,
         final_epsilon: float,
         discount_factor: float = 0.95,
+        training_error_size: int = 1_000_000,
     ):
         """Initialize a Reinforcement Learning agent with an empty dictionary
         of state-action values (q_values), a learning rate and an epsilon.
@@ -26,6 +63,7 @@ class BalatroAgent:
             epsilon_decay: The decay for epsilon
             final_epsilon: The final epsilon value
             discount_factor: The discount factor for computing the Q-value
+            training_error_size: How many of the most recent TD errors to keep
         """
         self.env = env
         self.q_values = defaultdict(lambda: np.zeros(env.action_space.n))
@@ -37,98 +75,82 @@ class BalatroAgent:
         self.epsilon_decay = epsilon_decay
         self.final_epsilon = final_epsilon
 
-        self.training_error = []
+        # Ring buffer of the most recent TD errors, avoids growing a list of
+        # boxed floats for every step of training
+        self.training_error = np.zeros(training_error_size, dtype=np.float32)
+        self._te_i = 0
 
-    def get_action(self, obs: dict) -> int:
+        # Uniform draws are taken from numpy in blocks and served one at a
+        # time, calling into the global RandomState per step is slow
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.random(RAND_BLOCK)
+        self._rand_i = 0
+
+    def get_action(self, obs: np.ndarray) -> int:
         """
         Returns the best action with probability (1 - epsilon)
         otherwise a random action with probability epsilon to ensure exploration.
         """
+        # fetch the mask once and share it between both branches
         mask = self.env.unwrapped.action_mask()
         # with probability epsilon return a random action to explore the environment
-        if np.random.random() < self.epsilon:
-            return self.get_rand_action(obs)
-        else:
-            # get best action, use it only if its valid
-            action = self.get_best_action(obs)
-            if mask[action] == 1:
-                return action
-            else:
-                return self.get_rand_action(obs)
-
-    def get_rand_action(self, obs: dict) -> int:
-        mask = self.env.unwrapped.action_mask()
-        space = self.env.action_space
-        action = space.sample(mask)
-        return action
-
-    def get_best_action(self, obs: dict) -> int:
-        obs_tuple = (
-            obs["score"],
-            obs["target"],
-            obs["stage"],
-            obs["round"],
-            obs["plays"],
-            obs["discards"],
-            obs["money"],
-            obs["deck_len"],
-            obs["selected_len"],
-            obs["available_len"],
-            obs["discarded_len"],
-            obs["jokers_len"],
-        )
-        action = np.argmax(self.q_values[obs_tuple])
+        if self._rand() < self.epsilon:
+            return self.get_rand_action(mask)
+        # get best action, use it only if its valid
+        action = self.get_best_action(obs)
+        if mask[action] == 1:
+            return action
+        return self.get_rand_action(mask)
+
+    def get_rand_action(self, mask: np.ndarray) -> int:
+        # sample directly from the legal indices, space.sample(mask) does the
+        # same filtering with more overhead
+        return int(_pick_legal(mask, self._rand()))
+
+    def _rand(self) -> float:
+        """Returns the next uniform draw in [0, 1) from the block buffer."""
+        if self._rand_i >= RAND_BLOCK:
+            self._rand_buf = self._rng.random(RAND_BLOCK)
+            self._rand_i = 0
+        value = self._rand_buf[self._rand_i]
+        self._rand_i += 1
+        return value
+
+    def _key(self, obs: np.ndarray) -> bytes:
+        # observations are small fixed-size int arrays, their raw bytes make
+        # a cheap dict key
+        return obs.tobytes()
+
+    def get_best_action(self, obs: np.ndarray) -> int:
+        action = np.argmax(self.q_values[self._key(obs)])
         return action
 
     def update(
         self,
-        obs: dict[str, int],
+        obs: np.ndarray,
         action: int,
         reward: float,
         terminated: bool,
-        next_obs: dict[str, int],
+        next_obs: np.ndarray,
     ):
         """Updates the Q-value of an action."""
-        obs_tuple = (
-            obs["score"],
-            obs["target"],
-            obs["stage"],
-            obs["round"],
-            obs["plays"],
-            obs["discards"],
-            obs["money"],
-            obs["deck_len"],
-            obs["selected_len"],
-            obs["available_len"],
-            obs["discarded_len"],
-            obs["jokers_len"],
-        )
-        next_obs_tuple = (
-            next_obs["score"],
-            next_obs["target"],
-            next_obs["stage"],
-            next_obs["round"],
-            next_obs["plays"],
-            next_obs["discards"],
-            next_obs["money"],
-            next_obs["deck_len"],
-            next_obs["selected_len"],
-            next_obs["available_len"],
-            next_obs["discarded_len"],
-            next_obs["jokers_len"],
-        )
-
-        future_q_value = (not terminated) * np.max(self.q_values[next_obs_tuple])
-        temporal_difference = (
-            reward
-            + self.discount_factor * future_q_value
-            - self.q_values[obs_tuple][action]
+        temporal_difference = _td_update(
+            self.q_values[self._key(obs)],
+            self.q_values[self._key(next_obs)],
+            action,
+            float(reward),
+            terminated,
+            self.lr,
+            self.discount_factor,
         )
+        self.training_error[self._te_i % self.training_error.size] = temporal_difference
+        self._te_i += 1
 
-        self.q_values[obs_tuple][action] = (
-            self.q_values[obs_tuple][action] + self.lr * temporal_difference
-        )
-        self.training_error.append(temporal_difference)
+    def recent_training_error(self) -> np.ndarray:
+        """Returns the recorded TD errors, oldest first."""
+        if self._te_i <= self.training_error.size:
+            return self.training_error[: self._te_i]
+        return np.roll(self.training_error, -(self._te_i % self.training_error.size))
 
     def decay_epsilon(self):
         self.epsilon = max(self.final_epsilon, self.epsilon - self.epsilon_decay)
@@ -143,8 +165,7 @@ def train():
     final_epsilon = 0.1
 
     register()
-    env = gym.make("gymnasium_env/Balatro-v0")
-    env = gym.wrappers.RecordEpisodeStatistics(env, buffer_length=n_episodes)
+    env = gym.make("gymnasium_env/Balatro-v0", max_episodes=n_episodes)
 
     agent = BalatroAgent(
         env=env,
@@ -178,35 +199,43 @@ def plot(env, agent):
     # visualize the episode rewards, episode length and training error in one figure
     fig, axs = plt.subplots(1, 5, figsize=(20, 8))
     base_env = env.unwrapped
+    n_recorded = min(base_env.episode_count, base_env.return_buf.size)
+    returns = base_env.return_buf[:n_recorded]
+    lengths = base_env.length_buf[:n_recorded]
 
     # np.convolve will compute the rolling mean for 100 episodes
     roll_eps = 10
-    # axs[0].plot(env.return_queue)
-    axs[0].plot(np.convolve(env.return_queue, np.ones(roll_eps)) / roll_eps)
+    # mean kernel, valid mode keeps the output the length of the full windows
+    kernel = np.full(roll_eps, 1.0 / roll_eps, dtype=np.float32)
+    # axs[0].plot(returns)
+    axs[0].plot(np.convolve(returns, kernel, mode="valid"))
     axs[0].set_title("Episode Rewards")
     axs[0].set_xlabel("Episode")
     axs[0].set_ylabel("Reward")
 
-    axs[1].plot(env.length_queue)
-    axs[1].plot(np.convolve(env.length_queue, np.ones(roll_eps)) / roll_eps)
+    axs[1].plot(lengths)
+    axs[1].plot(np.convolve(lengths.astype(np.float32), kernel, mode="valid"))
     axs[1].set_title("Episode Lengths")
     axs[1].set_xlabel("Episode")
     axs[1].set_ylabel("Length")
 
-    axs[2].plot(agent.training_error)
-    axs[2].plot(np.convolve(agent.training_error, np.ones(roll_eps)) / roll_eps)
+    training_error = agent.recent_training_error()
+    axs[2].plot(training_error)
+    axs[2].plot(np.convolve(training_error, kernel, mode="valid"))
     axs[2].set_title("Training Error")
     axs[2].set_xlabel("Episode")
     axs[2].set_ylabel("Temporal Difference")
 
     axs[3].plot(base_env.score_queue)
-    # axs[3].plot(np.convolve(np.asarray(base_env.score_queue), np.ones(roll_eps)))
-    axs[3].set_title("Scores")
+    # axs[3].plot(np.convolve(np.asarray(base_env.score_queue, dtype=np.float32), kernel, mode="valid"))
+    # high score is reduced once here rather than tracked on every step
+    high_score = np.max(base_env.score_queue) if base_env.score_queue else 0
+    axs[3].set_title(f"Scores (high score: {high_score})")
     axs[3].set_xlabel("Episode")
     axs[3].set_ylabel("Score")
 
     axs[4].plot(base_env.actions_queue)
-    # axs[4].plot(np.convolve(np.asarray(base_env.actions_queue), np.ones(roll_eps)))
+    # axs[4].plot(np.convolve(np.asarray(base_env.actions_queue, dtype=np.float32), kernel, mode="valid"))
     axs[4].set_title("Actions Length")
     axs[4].set_xlabel("Episode")
     axs[4].set_ylabel("Actions")
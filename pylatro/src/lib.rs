@@ -11,10 +11,20 @@ use balatro_rs::joker_metadata::JokerMetadata;
 use balatro_rs::joker_registry::{
     calculate_joker_cost, registry, JokerDefinition, UnlockCondition,
 };
+use balatro_rs::joker_state::JokerState;
 use balatro_rs::stage::{End, Stage};
+use pyo3::exceptions::{PyDeprecationWarning, PyUserWarning};
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyDict, PyFrozenSet, PyList, PyString, PyTuple};
+use pyo3::PyTypeInfo;
 use pyo3::{PyResult, Python};
-use std::collections::HashMap;
+use rand::rngs::StdRng;
+use rand::{Rng, SeedableRng};
+use rayon::prelude::*;
+use std::ffi::CStr;
+use std::fmt::Write;
 
 // Security constants for input validation
 const MAX_CUSTOM_DATA_KEY_LENGTH: usize = 256;
@@ -73,9 +83,20 @@ impl GameStateSnapshot {
 #[pyclass]
 struct GameEngine {
     game: Game,
+    // Incremented whenever the game changes, cached data tagged with an
+    // older version is stale
+    state_version: u64,
+    cached_actions: Option<(u64, Py<PyTuple>)>,
+    cached_state: Option<(u64, Py<GameState>)>,
+    // Action names by action space index, filled in as they are asked for
+    cached_action_names: Option<(u64, Vec<Option<Py<PyString>>>)>,
 }
 
-impl GameEngine {}
+impl GameEngine {
+    fn invalidate(&mut self) {
+        self.state_version = self.state_version.wrapping_add(1);
+    }
+}
 
 #[pymethods]
 impl GameEngine {
@@ -84,29 +105,156 @@ impl GameEngine {
     fn new(config: Option<Config>) -> Self {
         GameEngine {
             game: Game::new(config.unwrap_or_default()),
+            state_version: 0,
+            cached_actions: None,
+            cached_state: None,
+            cached_action_names: None,
         }
     }
 
+    /// Reset the engine to a new game, reusing its allocations
+    fn reset(&mut self) {
+        self.game.reset_game();
+        self.invalidate();
+    }
+
     fn gen_actions(&self) -> Vec<Action> {
         self.game.gen_actions().collect()
     }
 
-    fn gen_action_space(&self) -> Vec<usize> {
-        self.game.gen_action_space().to_vec()
+    /// Same as gen_actions, but returns the actions as a tuple which is
+    /// shared between calls until the game state changes
+    fn get_cached_actions<'py>(&mut self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        if let Some((version, actions)) = &self.cached_actions {
+            if *version == self.state_version {
+                return Ok(actions.bind(py).clone());
+            }
+        }
+        let actions = PyTuple::new(py, self.game.gen_actions().collect::<Vec<_>>())?;
+        self.cached_actions = Some((self.state_version, actions.clone().unbind()));
+        Ok(actions)
+    }
+
+    fn gen_action_space(&self, py: Python<'_>) -> Vec<usize> {
+        // Pure Rust work, other python threads can run meanwhile
+        let game = &self.game;
+        py.allow_threads(|| game.gen_action_space().to_vec())
+    }
+
+    /// Observation vector for the gym environment in a single call:
+    /// [score, required_score, stage, round, plays, discards, money,
+    ///  deck, selected, available, discarded, jokers]
+    fn obs_vector(&self) -> [i64; 12] {
+        let game = &self.game;
+        [
+            game.score as i64,
+            game.required_score() as i64,
+            game.stage.int() as i64,
+            game.round as i64,
+            game.plays as i64,
+            game.discards as i64,
+            game.money as i64,
+            game.deck.len() as i64,
+            game.available.selected_len() as i64,
+            game.available.len() as i64,
+            game.discarded.len() as i64,
+            game.joker_count() as i64,
+        ]
+    }
+
+    /// Action space mask packed one byte per action, for zero-copy use
+    /// with `numpy.frombuffer` instead of converting a list element by element
+    fn gen_action_space_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        // The mask is written straight into the bytes object, without an
+        // intermediate Vec
+        let space = self.game.gen_action_space();
+        PyBytes::new_with(py, space.size(), |bytes| {
+            for (byte, valid) in bytes.iter_mut().zip(space.iter()) {
+                *byte = valid as u8;
+            }
+            Ok(())
+        })
     }
 
-    fn handle_action(&mut self, action: Action) -> Result<(), GameError> {
-        self.game.handle_action(action)
+    fn handle_action(&mut self, py: Python<'_>, action: Action) -> Result<(), GameError> {
+        self.invalidate();
+        let game = &mut self.game;
+        py.allow_threads(|| game.handle_action(action))
     }
 
-    fn handle_action_index(&mut self, index: usize) -> Result<(), GameError> {
-        self.game.handle_action_index(index)
+    /// Handle the action at `index`, returning whether the game is now over
+    /// so callers can skip a separate `is_over` lookup
+    fn handle_action_index(&mut self, py: Python<'_>, index: usize) -> Result<bool, GameError> {
+        self.invalidate();
+        let game = &mut self.game;
+        py.allow_threads(|| {
+            game.handle_action_index(index)?;
+            Ok(game.is_over())
+        })
+    }
+
+    /// Handle the action at `index` and return `(is_over, is_win, mask)`,
+    /// where mask is the next action space as from `gen_action_space_bytes`.
+    /// Drives a game with one call per move
+    fn step<'py>(
+        &mut self,
+        py: Python<'py>,
+        index: usize,
+    ) -> PyResult<(bool, bool, Bound<'py, PyBytes>)> {
+        let is_over = self.handle_action_index(py, index)?;
+        Ok((is_over, self.is_win(), self.gen_action_space_bytes(py)?))
+    }
+
+    /// Apply one legal action chosen uniformly at random, without building
+    /// the action space in python. Returns true once the game is over or no
+    /// action is legal. `seed` seeds the choice of action
+    #[pyo3(signature = (seed=None))]
+    fn step_random(&mut self, seed: Option<u64>) -> Result<bool, GameError> {
+        self.invalidate();
+        let stepped = match seed {
+            Some(seed) => step_random(&mut self.game, &mut StdRng::seed_from_u64(seed))?,
+            None => step_random(&mut self.game, &mut rand::thread_rng())?,
+        };
+        Ok(!stepped || self.game.is_over())
+    }
+
+    /// Play the rest of the game with random legal actions in one call, with
+    /// the GIL released. Returns a tuple of (is_over, is_win, moves)
+    #[pyo3(signature = (seed=None))]
+    fn play_until_done(
+        &mut self,
+        py: Python<'_>,
+        seed: Option<u64>,
+    ) -> Result<(bool, bool, usize), GameError> {
+        self.invalidate();
+        let game = &mut self.game;
+        let moves = py.allow_threads(|| match seed {
+            Some(seed) => play_random(game, &mut StdRng::seed_from_u64(seed)),
+            None => play_random(game, &mut rand::thread_rng()),
+        })?;
+        Ok((self.game.is_over(), self.is_win(), moves))
     }
 
-    fn get_action_name(&self, index: usize) -> Result<String, GameError> {
+    fn get_action_name(&mut self, py: Python<'_>, index: usize) -> PyResult<Py<PyString>> {
+        // Names depend on the cards in play, so they are only reused until
+        // the game changes
+        let names = match &mut self.cached_action_names {
+            Some((version, names)) if *version == self.state_version => names,
+            cached => &mut cached.insert((self.state_version, Vec::new())).1,
+        };
+        if let Some(Some(name)) = names.get(index) {
+            return Ok(name.clone_ref(py));
+        }
         let space = self.game.gen_action_space();
-        let action = space.to_action(index, &self.game)?;
-        Ok(format!("{action}"))
+        let action = space
+            .to_action(index, &self.game)
+            .map_err(GameError::from)?;
+        let name = PyString::new(py, &format!("{action}")).unbind();
+        if names.len() <= index {
+            names.resize_with(index + 1, || None);
+        }
+        names[index] = Some(name.clone_ref(py));
+        Ok(name)
     }
 
     /// Get joker information by ID
@@ -114,240 +262,224 @@ impl GameEngine {
         registry::get_definition(&joker_id)
     }
 
+    /// Get joker information for several ids in one call, in the order
+    /// requested. Unknown ids give None
+    fn get_joker_infos(
+        &self,
+        py: Python<'_>,
+        joker_ids: Vec<JokerId>,
+    ) -> PyResult<Vec<Option<Py<JokerDefinition>>>> {
+        let cache = joker_metadata_cache(py)?;
+        Ok(joker_ids
+            .into_iter()
+            .map(|joker_id| {
+                cache
+                    .position(joker_id)
+                    .map(|i| cache.definitions[i].clone_ref(py))
+            })
+            .collect())
+    }
+
     /// Get all available joker definitions, optionally filtered by rarity
     #[pyo3(signature = (rarity=None))]
-    fn get_available_jokers(
+    fn get_available_jokers<'py>(
         &self,
+        py: Python<'py>,
         rarity: Option<JokerRarity>,
-    ) -> Result<Vec<JokerDefinition>, GameError> {
-        match rarity {
-            Some(r) => registry::definitions_by_rarity(r),
-            None => registry::all_definitions(),
-        }
+    ) -> PyResult<Bound<'py, PyList>> {
+        // Definitions are immutable from python, so the cached objects are
+        // shared rather than cloned out of the registry on every call. The
+        // lists are prebuilt as tuples, a call is one copy into a new list
+        let cache = joker_metadata_cache(py)?;
+        let definitions = match rarity {
+            Some(r) => &cache.definitions_by_rarity[rarity_slot(r)],
+            None => &cache.all_definitions,
+        };
+        Ok(definitions.bind(py).to_list())
     }
 
     /// Check if player can afford and has space for a joker
-    fn can_buy_joker(&self, joker_id: JokerId) -> bool {
+    fn can_buy_joker(&self, py: Python<'_>, joker_id: JokerId) -> PyResult<bool> {
         // Check if player has space
         if self.game.joker_count() >= self.game.config.joker_slots_max {
-            return false;
+            return Ok(false);
         }
 
         // Check if player can afford it
-        if let Ok(Some(definition)) = registry::get_definition(&joker_id) {
-            let cost = calculate_joker_cost(definition.rarity) as usize;
-            return self.game.money >= cost as f64;
-        }
-
-        false
+        Ok(match self.get_joker_cost(py, joker_id)? {
+            Some(cost) => self.game.money >= cost as f64,
+            None => false,
+        })
     }
 
     /// Get the cost of a specific joker
-    fn get_joker_cost(&self, joker_id: JokerId) -> Result<Option<usize>, GameError> {
-        if let Some(definition) = registry::get_definition(&joker_id)? {
-            Ok(Some(calculate_joker_cost(definition.rarity) as usize))
-        } else {
-            Ok(None)
-        }
+    fn get_joker_cost(&self, py: Python<'_>, joker_id: JokerId) -> PyResult<Option<usize>> {
+        let cache = joker_metadata_cache(py)?;
+        Ok(cache.position(joker_id).map(|i| cache.costs[i] as usize))
+    }
+
+    /// Get the costs of several jokers in one call, in the order requested.
+    /// Unknown ids give None
+    fn get_joker_costs(
+        &self,
+        py: Python<'_>,
+        joker_ids: Vec<JokerId>,
+    ) -> PyResult<Vec<Option<usize>>> {
+        let cache = joker_metadata_cache(py)?;
+        Ok(joker_ids
+            .into_iter()
+            .map(|joker_id| cache.position(joker_id).map(|i| cache.costs[i] as usize))
+            .collect())
     }
 
     /// Get comprehensive metadata for a specific joker
-    fn get_joker_metadata(&self, joker_id: JokerId) -> Result<Option<JokerMetadata>, GameError> {
-        let definition = registry::get_definition(&joker_id)?;
-
-        match definition {
-            Some(def) => {
-                // Check if joker is unlocked based on game progress
-                let is_unlocked = def
-                    .unlock_condition
-                    .as_ref()
-                    .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                    .unwrap_or(true); // No unlock condition means always unlocked
-                let metadata = JokerMetadata::from_definition(&def, is_unlocked);
-                Ok(Some(metadata))
-            }
-            None => Ok(None),
-        }
+    fn get_joker_metadata(
+        &self,
+        py: Python<'_>,
+        joker_id: JokerId,
+    ) -> PyResult<Option<Py<JokerMetadata>>> {
+        Ok(joker_metadata_cache(py)?
+            .get(joker_id)
+            .map(|cached| cached.for_game(py, &self.game)))
     }
 
     /// Get basic properties as dictionary
-    fn get_joker_properties(&self, joker_id: JokerId) -> Option<pyo3::PyObject> {
-        let definition = match registry::get_definition(&joker_id) {
-            Ok(Some(def)) => def,
-            Ok(None) => return None,
-            Err(_) => return None,
-        };
-
-        let cost = calculate_joker_cost(definition.rarity);
-
-        pyo3::Python::with_gil(|py| {
-            let dict = pyo3::types::PyDict::new(py);
-            let _ = dict.set_item("name", &definition.name);
-            let _ = dict.set_item("description", &definition.description);
-            let _ = dict.set_item("rarity", format!("{:?}", definition.rarity));
-            let _ = dict.set_item("cost", cost);
-
-            Some(dict.into())
-        })
+    fn get_joker_properties(&self, py: Python<'_>, joker_id: JokerId) -> Option<pyo3::PyObject> {
+        // Copy the prebuilt dict so callers can't modify the shared one
+        let cached = joker_metadata_cache(py).ok()?.get(joker_id)?;
+        let dict = cached.properties.bind(py).copy().ok()?;
+        Some(dict.into_any().unbind())
     }
 
     /// Get joker effect descriptions and parameters
-    fn get_joker_effect_info(&self, joker_id: JokerId) -> Option<pyo3::PyObject> {
-        let definition = match registry::get_definition(&joker_id) {
-            Ok(Some(def)) => def,
-            Ok(None) => return None,
-            Err(_) => return None,
-        };
+    fn get_joker_effect_info(&self, py: Python<'_>, joker_id: JokerId) -> Option<pyo3::PyObject> {
+        let cached = joker_metadata_cache(py).ok()?.get(joker_id)?;
+        let dict = copy_effect_info(cached.effect_info.bind(py)).ok()?;
+        Some(dict.into_any().unbind())
+    }
 
-        // Determine effect type and triggers based on joker ID
-        let (effect_type, triggers_on) = match joker_id {
-            JokerId::Joker => ("Basic Mult", vec!["hand_played"]),
-            JokerId::GreedyJoker
-            | JokerId::LustyJoker
-            | JokerId::WrathfulJoker
-            | JokerId::GluttonousJoker => ("Conditional Mult", vec!["card_scored"]),
-            _ => ("Effect", vec![]),
-        };
+    /// Read-only view of a joker's properties, shared between calls rather
+    /// than copied. Use `get_joker_properties` for a dict that can be modified
+    fn get_joker_properties_view(&self, py: Python<'_>, joker_id: JokerId) -> Option<Py<PyAny>> {
+        let cached = joker_metadata_cache(py).ok()?.get(joker_id)?;
+        Some(cached.properties_view.clone_ref(py))
+    }
 
-        pyo3::Python::with_gil(|py| {
-            let dict = pyo3::types::PyDict::new(py);
-            let _ = dict.set_item("effect_type", effect_type);
-            let _ = dict.set_item("description", &definition.description);
-            // Extract parameters based on joker implementation
-            let parameters = extract_joker_parameters(joker_id, py);
-            let _ = dict.set_item("parameters", parameters);
-            let _ = dict.set_item("triggers_on", triggers_on);
-
-            Some(dict.into())
-        })
+    /// Read-only view of a joker's effect info, shared between calls. The
+    /// parameters are a read-only mapping and the triggers a frozenset, so
+    /// `trigger in view["triggers_on"]` is a hash lookup
+    fn get_joker_effect_info_view(&self, py: Python<'_>, joker_id: JokerId) -> Option<Py<PyAny>> {
+        let cached = joker_metadata_cache(py).ok()?.get(joker_id)?;
+        Some(cached.effect_info_view.clone_ref(py))
     }
 
     /// Get unlock condition and status
-    fn get_joker_unlock_status(&self, joker_id: JokerId) -> Option<pyo3::PyObject> {
-        let definition = match registry::get_definition(&joker_id) {
-            Ok(Some(def)) => def,
-            Ok(None) => return None,
-            Err(_) => return None,
-        };
+    fn get_joker_unlock_status(&self, py: Python<'_>, joker_id: JokerId) -> Option<pyo3::PyObject> {
+        let cached = joker_metadata_cache(py).ok()?.get(joker_id)?;
 
-        pyo3::Python::with_gil(|py| {
-            let dict = pyo3::types::PyDict::new(py);
-            // Check if joker is unlocked based on game progress
-            let is_unlocked = definition
-                .unlock_condition
-                .as_ref()
-                .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                .unwrap_or(true); // No unlock condition means always unlocked
-            let _ = dict.set_item("is_unlocked", is_unlocked);
-
-            // Add unlock condition if it exists
-            match &definition.unlock_condition {
-                Some(condition) => {
-                    let _ = dict.set_item("unlock_condition", format!("{condition:?}"));
-                }
-                None => {
-                    let _ = dict.set_item("unlock_condition", py.None());
-                }
-            }
+        // Only the unlock check depends on the game, the condition text is cached
+        let dict = PyDict::new(py);
+        let _ = dict.set_item(intern!(py, "is_unlocked"), cached.is_unlocked(&self.game));
+        let _ = dict.set_item(
+            intern!(py, "unlock_condition"),
+            cached.unlock_condition_repr.bind(py),
+        );
 
-            Some(dict.into())
-        })
+        Some(dict.into_any().unbind())
     }
 
     /// Get metadata for multiple jokers efficiently
     /// Returns a dictionary with JokerId objects as keys and JokerMetadata as values
-    fn get_multiple_joker_metadata(&self, joker_ids: Vec<JokerId>) -> pyo3::PyObject {
-        pyo3::Python::with_gil(|py| {
-            let dict = pyo3::types::PyDict::new(py);
-
-            // Acquire registry lock once for batch operation - fixes N+1 pattern
-            if let Ok(all_definitions) = registry::all_definitions() {
-                let definition_map: HashMap<JokerId, &JokerDefinition> =
-                    all_definitions.iter().map(|def| (def.id, def)).collect();
-
-                for joker_id in joker_ids {
-                    if let Some(definition) = definition_map.get(&joker_id) {
-                        let is_unlocked = definition
-                            .unlock_condition
-                            .as_ref()
-                            .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                            .unwrap_or(true);
-                        let metadata = JokerMetadata::from_definition(definition, is_unlocked);
-                        let _ = dict.set_item(format!("{joker_id:?}"), metadata);
-                    }
-                }
+    fn get_multiple_joker_metadata<'py>(
+        &self,
+        py: Python<'py>,
+        joker_ids: Vec<JokerId>,
+    ) -> PyResult<Bound<'py, PyDict>> {
+        let cache = joker_metadata_cache(py)?;
+        let dict = PyDict::new(py);
+
+        // Ids are extracted in one pass by the argument conversion, each
+        // entry is then a lookup and refcount bump on the cached objects
+        for joker_id in joker_ids {
+            if let Some(cached) = cache.get(joker_id) {
+                dict.set_item(&cached.key, cached.for_game(py, &self.game))?;
             }
+        }
 
-            dict.into()
-        })
+        Ok(dict)
+    }
+
+    /// Get metadata for multiple jokers as a list in the order requested
+    /// Unknown ids are skipped. Cheaper than the dict form when the caller
+    /// only iterates the results
+    fn get_multiple_joker_metadata_list(
+        &self,
+        py: Python<'_>,
+        joker_ids: Vec<JokerId>,
+    ) -> PyResult<Vec<Py<JokerMetadata>>> {
+        let cache = joker_metadata_cache(py)?;
+        let mut metadata = Vec::with_capacity(joker_ids.len());
+        metadata.extend(
+            joker_ids
+                .into_iter()
+                .filter_map(|joker_id| cache.get(joker_id))
+                .map(|cached| cached.for_game(py, &self.game)),
+        );
+        Ok(metadata)
     }
 
     /// Get metadata for all jokers in the registry  
-    /// Returns a dictionary with JokerId string names as keys and JokerMetadata as values
-    fn get_all_joker_metadata(&self) -> pyo3::PyObject {
-        pyo3::Python::with_gil(|py| {
-            let dict = pyo3::types::PyDict::new(py);
+    /// Returns a dictionary with JokerId objects as keys and JokerMetadata as values
+    fn get_all_joker_metadata<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let cache = joker_metadata_cache(py)?;
+        let dict = PyDict::new(py);
 
-            // Get all available jokers and their metadata - single registry access fixes N+1 pattern
-            if let Ok(all_jokers) = registry::all_definitions() {
-                for definition in all_jokers {
-                    let is_unlocked = definition
-                        .unlock_condition
-                        .as_ref()
-                        .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                        .unwrap_or(true);
-                    let metadata = JokerMetadata::from_definition(&definition, is_unlocked);
-                    let _ = dict.set_item(format!("{0:?}", definition.id), metadata);
-                }
-            }
+        // Metadata objects are built once and shared, no registry access here
+        for cached in &cache.entries {
+            dict.set_item(&cached.key, cached.for_game(py, &self.game))?;
+        }
 
-            dict.into()
-        })
+        Ok(dict)
     }
 
-    /// Get jokers by rarity with optional full metadata
-    #[pyo3(signature = (rarity, include_metadata=true))]
+    /// Get metadata for the jokers of one rarity
+    ///
+    /// `include_metadata` is deprecated and ignored: full metadata is always
+    /// returned, since it comes from the same cached objects as the minimal form
+    #[pyo3(signature = (rarity, include_metadata=None))]
     fn get_jokers_by_rarity(
         &self,
+        py: Python<'_>,
         rarity: JokerRarity,
-        include_metadata: bool,
-    ) -> Vec<JokerMetadata> {
-        let include_full = include_metadata;
-
-        if let Ok(jokers) = registry::definitions_by_rarity(rarity) {
-            jokers
-                .into_iter()
-                .filter_map(|def| {
-                    if include_full {
-                        self.get_joker_metadata(def.id).ok().flatten()
-                    } else {
-                        // Create minimal metadata with proper unlock checking
-                        let is_unlocked = def
-                            .unlock_condition
-                            .as_ref()
-                            .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                            .unwrap_or(true); // No unlock condition means always unlocked
-                        Some(JokerMetadata::from_definition(&def, is_unlocked))
-                    }
-                })
-                .collect()
-        } else {
-            Vec::new()
+        include_metadata: Option<bool>,
+    ) -> PyResult<Vec<Py<JokerMetadata>>> {
+        if include_metadata.is_some() {
+            warn::<PyDeprecationWarning>(
+                py,
+                c"get_jokers_by_rarity(include_metadata=...) is deprecated and ignored. Full metadata is always returned.",
+                2,
+            )?;
         }
+
+        Ok(match joker_metadata_cache(py) {
+            Ok(cache) => cache.by_rarity[rarity_slot(rarity)]
+                .iter()
+                .map(|&i| cache.entries[i].for_game(py, &self.game))
+                .collect(),
+            Err(_) => Vec::new(),
+        })
     }
 
     /// Get metadata for all currently unlocked jokers
-    fn get_unlocked_jokers_metadata(&self) -> Vec<JokerMetadata> {
-        if let Ok(all_jokers) = registry::all_definitions() {
-            all_jokers
-                .into_iter()
-                .filter_map(|def| {
-                    // For now, assume all jokers are unlocked
-                    self.get_joker_metadata(def.id).ok().flatten()
-                })
-                .collect()
-        } else {
-            Vec::new()
+    fn get_unlocked_jokers_metadata(&self, py: Python<'_>) -> Vec<Py<JokerMetadata>> {
+        match joker_metadata_cache(py) {
+            Ok(cache) => cache
+                .entries
+                .iter()
+                // For now, assume all jokers are unlocked
+                .map(|cached| cached.for_game(py, &self.game))
+                .collect(),
+            Err(_) => Vec::new(),
         }
     }
 
@@ -371,27 +503,7 @@ impl GameEngine {
                     // Create custom data dictionary
                     let custom_data_dict = pyo3::types::PyDict::new(py);
                     for (key, value) in &joker_state.custom_data {
-                        // Convert serde_json::Value to Python object
-                        let py_value = match value {
-                            serde_json::Value::Null => py.None(),
-                            serde_json::Value::Bool(b) => b.to_object(py),
-                            serde_json::Value::Number(n) => {
-                                if let Some(i) = n.as_i64() {
-                                    i.to_object(py)
-                                } else if let Some(f) = n.as_f64() {
-                                    f.to_object(py)
-                                } else {
-                                    py.None()
-                                }
-                            }
-                            serde_json::Value::String(s) => s.to_object(py),
-                            serde_json::Value::Array(_) | serde_json::Value::Object(_) => {
-                                // For complex types, serialize to string for now
-                                serde_json::to_string(&value)
-                                    .unwrap_or_default()
-                                    .to_object(py)
-                            }
-                        };
+                        let py_value = json_to_py(py, value);
                         let _ = custom_data_dict.set_item(key, py_value);
                     }
                     let _ = dict.set_item("custom_data", custom_data_dict);
@@ -427,57 +539,21 @@ impl GameEngine {
         pyo3::Python::with_gil(|py| {
             let dict = pyo3::types::PyDict::new(py);
 
-            for joker in &self.game.jokers {
-                let joker_id = joker.id();
-                let state_dict = pyo3::types::PyDict::new(py);
-
-                // Get actual state from the joker state manager
-                if let Some(joker_state) = self.game.joker_state_manager.get_state(joker_id) {
-                    let _ = state_dict.set_item("accumulated_value", joker_state.accumulated_value);
-                    let _ =
-                        state_dict.set_item("triggers_remaining", joker_state.triggers_remaining);
-
-                    // Add custom data
-                    let custom_data_dict = pyo3::types::PyDict::new(py);
-                    for (key, value) in &joker_state.custom_data {
-                        let py_value = match value {
-                            serde_json::Value::Null => py.None(),
-                            serde_json::Value::Bool(b) => b.to_object(py),
-                            serde_json::Value::Number(n) => {
-                                if let Some(i) = n.as_i64() {
-                                    i.to_object(py)
-                                } else if let Some(f) = n.as_f64() {
-                                    f.to_object(py)
-                                } else {
-                                    py.None()
-                                }
-                            }
-                            serde_json::Value::String(s) => s.to_object(py),
-                            serde_json::Value::Array(_) | serde_json::Value::Object(_) => {
-                                serde_json::to_string(&value)
-                                    .unwrap_or_default()
-                                    .to_object(py)
-                            }
-                        };
-                        let _ = custom_data_dict.set_item(key, py_value);
-                    }
-                    let _ = state_dict.set_item("custom_data", custom_data_dict);
-                } else {
-                    // No state exists yet - return default values
-                    let _ = state_dict.set_item("accumulated_value", 0.0f64);
-                    let _ = state_dict.set_item("triggers_remaining", py.None());
-                    let _ = state_dict.set_item("custom_data", pyo3::types::PyDict::new(py));
+            // Read every state under one lock rather than cloning each one
+            self.game.joker_state_manager.with_states(|states| {
+                for joker in &self.game.jokers {
+                    let joker_id = joker.id();
+                    let state_dict = joker_state_dict(py, states.get(&joker_id));
+                    let _ = dict.set_item(format!("{joker_id:?}"), state_dict);
                 }
-
-                let _ = dict.set_item(format!("{joker_id:?}"), state_dict);
-            }
+            });
 
             dict.into()
         })
     }
 
     /// Search jokers by name or description
-    fn search_jokers(&self, query: &str) -> PyResult<Vec<JokerMetadata>> {
+    fn search_jokers(&self, py: Python<'_>, query: &str) -> PyResult<Vec<Py<JokerMetadata>>> {
         // Input validation for security
         if query.len() > MAX_SEARCH_QUERY_LENGTH {
             return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
@@ -485,87 +561,78 @@ impl GameEngine {
             )));
         }
 
+        let Ok(cache) = joker_metadata_cache(py) else {
+            return Ok(Vec::new());
+        };
+
+        // Names and descriptions are lowercased once when the cache is built,
+        // only the query needs lowercasing here
         let query_lower = query.to_lowercase();
 
-        if let Ok(all_jokers) = registry::all_definitions() {
-            Ok(all_jokers
-                .into_iter()
-                .filter(|def| {
-                    def.name.to_lowercase().contains(&query_lower)
-                        || def.description.to_lowercase().contains(&query_lower)
-                })
-                .filter_map(|def| self.get_joker_metadata(def.id).ok().flatten())
-                .collect())
-        } else {
-            Ok(Vec::new())
-        }
+        Ok(cache
+            .names_lower
+            .iter()
+            .zip(&cache.descriptions_lower)
+            .enumerate()
+            .filter(|(_, (name, description))| {
+                name.contains(query_lower.as_str()) || description.contains(query_lower.as_str())
+            })
+            .map(|(i, _)| cache.entries[i].for_game(py, &self.game))
+            .collect())
     }
 
     /// Filter jokers by multiple criteria
     #[pyo3(signature = (rarity=None, unlocked_only=false, affordable_only=false))]
     fn filter_jokers(
         &self,
+        py: Python<'_>,
         rarity: Option<JokerRarity>,
         unlocked_only: bool,
         affordable_only: bool,
-    ) -> Vec<JokerMetadata> {
-        if let Ok(all_jokers) = registry::all_definitions() {
-            all_jokers
-                .into_iter()
-                .filter(|def| {
-                    // Filter by rarity if specified
-                    if let Some(r) = rarity {
-                        if def.rarity != r {
-                            return false;
-                        }
-                    }
-
-                    // Filter by unlock status if requested
-                    if unlocked_only {
-                        let is_unlocked = def
-                            .unlock_condition
-                            .as_ref()
-                            .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                            .unwrap_or(true); // No unlock condition means always unlocked
-                        if !is_unlocked {
-                            return false;
-                        }
-                    }
+    ) -> Vec<Py<JokerMetadata>> {
+        let Ok(cache) = joker_metadata_cache(py) else {
+            return Vec::new();
+        };
 
-                    // Filter by affordability if requested
-                    if affordable_only {
-                        let cost = calculate_joker_cost(def.rarity);
-                        if self.game.money < cost as f64 {
-                            return false;
-                        }
-                    }
+        // Rarity narrows the candidates through the precomputed index, the
+        // remaining checks read single columns of the cache
+        let indices = match rarity {
+            Some(r) => cache.filter_indices(
+                cache.by_rarity[rarity_slot(r)].iter().copied(),
+                &self.game,
+                unlocked_only,
+                affordable_only,
+            ),
+            None => cache.filter_indices(
+                0..cache.entries.len(),
+                &self.game,
+                unlocked_only,
+                affordable_only,
+            ),
+        };
 
-                    true
-                })
-                .filter_map(|def| self.get_joker_metadata(def.id).ok().flatten())
-                .collect()
-        } else {
-            Vec::new()
-        }
+        indices
+            .into_iter()
+            .map(|i| cache.entries[i].for_game(py, &self.game))
+            .collect()
     }
 
     /// Get jokers within a cost range
-    fn get_jokers_by_cost_range(&self, min_cost: i32, max_cost: i32) -> Vec<JokerMetadata> {
-        if let Ok(all_jokers) = registry::all_definitions() {
-            all_jokers
-                .into_iter()
-                .filter_map(|def| {
-                    let cost = calculate_joker_cost(def.rarity);
-
-                    if cost >= min_cost && cost <= max_cost {
-                        self.get_joker_metadata(def.id).ok().flatten()
-                    } else {
-                        None
-                    }
-                })
-                .collect()
-        } else {
-            Vec::new()
+    fn get_jokers_by_cost_range(
+        &self,
+        py: Python<'_>,
+        min_cost: i32,
+        max_cost: i32,
+    ) -> Vec<Py<JokerMetadata>> {
+        match joker_metadata_cache(py) {
+            Ok(cache) => cache
+                .costs
+                .iter()
+                .enumerate()
+                .filter(|(_, &cost)| cost >= min_cost && cost <= max_cost)
+                .map(|(i, _)| cache.entries[i].for_game(py, &self.game))
+                .collect(),
+            Err(_) => Vec::new(),
         }
     }
 
@@ -574,17 +641,9 @@ impl GameEngine {
         pyo3::Python::with_gil(|py| {
             let dict = pyo3::types::PyDict::new(py);
 
-            // Basic categorization based on joker types
-            let _ = dict.set_item("Basic Scoring", vec![JokerId::Joker]);
-            let _ = dict.set_item(
-                "Suit-based",
-                vec![
-                    JokerId::GreedyJoker,
-                    JokerId::LustyJoker,
-                    JokerId::WrathfulJoker,
-                    JokerId::GluttonousJoker,
-                ],
-            );
+            for (category, joker_ids) in JOKER_CATEGORIES {
+                let _ = dict.set_item(category, joker_ids.to_vec());
+            }
 
             dict.into()
         })
@@ -595,47 +654,26 @@ impl GameEngine {
         pyo3::Python::with_gil(|py| {
             let dict = pyo3::types::PyDict::new(py);
 
-            if let Ok(all_jokers) = registry::all_definitions() {
-                let total = all_jokers.len();
-                let _ = dict.set_item("total_jokers", total);
+            // Totals are fixed by the registry and read from the metadata
+            // cache, only unlock status depends on the game
+            if let Ok(cache) = joker_metadata_cache(py) {
+                let _ = dict.set_item(intern!(py, "total_jokers"), cache.entries.len());
 
-                // Count by rarity
                 let rarity_dict = pyo3::types::PyDict::new(py);
-                let mut common_count = 0;
-                let mut uncommon_count = 0;
-                let mut rare_count = 0;
-                let mut legendary_count = 0;
-
-                for joker in &all_jokers {
-                    match joker.rarity {
-                        JokerRarity::Common => common_count += 1,
-                        JokerRarity::Uncommon => uncommon_count += 1,
-                        JokerRarity::Rare => rare_count += 1,
-                        JokerRarity::Legendary => legendary_count += 1,
-                    }
-                }
-
-                let _ = rarity_dict.set_item("Common", common_count);
-                let _ = rarity_dict.set_item("Uncommon", uncommon_count);
-                let _ = rarity_dict.set_item("Rare", rare_count);
-                let _ = rarity_dict.set_item("Legendary", legendary_count);
-                let _ = dict.set_item("by_rarity", rarity_dict);
-
-                // Count actually unlocked jokers
-                let unlocked_count = all_jokers
-                    .iter()
-                    .filter(|def| {
-                        def.unlock_condition
-                            .as_ref()
-                            .map(|condition| evaluate_unlock_condition(condition, &self.game))
-                            .unwrap_or(true) // No unlock condition means always unlocked
-                    })
-                    .count();
-                let _ = dict.set_item("unlocked_count", unlocked_count);
+                let _ = rarity_dict.set_item(intern!(py, "Common"), cache.by_rarity[0].len());
+                let _ = rarity_dict.set_item(intern!(py, "Uncommon"), cache.by_rarity[1].len());
+                let _ = rarity_dict.set_item(intern!(py, "Rare"), cache.by_rarity[2].len());
+                let _ = rarity_dict.set_item(intern!(py, "Legendary"), cache.by_rarity[3].len());
+                let _ = dict.set_item(intern!(py, "by_rarity"), rarity_dict);
+
+                let _ = dict.set_item(
+                    intern!(py, "unlocked_count"),
+                    cache.unlocked_count(&self.game),
+                );
             } else {
-                let _ = dict.set_item("total_jokers", 0);
-                let _ = dict.set_item("by_rarity", pyo3::types::PyDict::new(py));
-                let _ = dict.set_item("unlocked_count", 0);
+                let _ = dict.set_item(intern!(py, "total_jokers"), 0);
+                let _ = dict.set_item(intern!(py, "by_rarity"), pyo3::types::PyDict::new(py));
+                let _ = dict.set_item(intern!(py, "unlocked_count"), 0);
             }
 
             dict.into()
@@ -661,28 +699,7 @@ impl GameEngine {
     fn get_joker_custom_data(&self, joker_id: JokerId, key: &str) -> Option<pyo3::PyObject> {
         if let Some(joker_state) = self.game.joker_state_manager.get_state(joker_id) {
             if let Some(value) = joker_state.custom_data.get(key) {
-                pyo3::Python::with_gil(|py| {
-                    let py_value = match value {
-                        serde_json::Value::Null => py.None(),
-                        serde_json::Value::Bool(b) => b.to_object(py),
-                        serde_json::Value::Number(n) => {
-                            if let Some(i) = n.as_i64() {
-                                i.to_object(py)
-                            } else if let Some(f) = n.as_f64() {
-                                f.to_object(py)
-                            } else {
-                                py.None()
-                            }
-                        }
-                        serde_json::Value::String(s) => s.to_object(py),
-                        serde_json::Value::Array(_) | serde_json::Value::Object(_) => {
-                            serde_json::to_string(&value)
-                                .unwrap_or_default()
-                                .to_object(py)
-                        }
-                    };
-                    Some(py_value)
-                })
+                Some(pyo3::Python::with_gil(|py| json_to_py(py, value)))
             } else {
                 None
             }
@@ -794,10 +811,44 @@ impl GameEngine {
     }
 
     #[getter]
-    fn state(&self) -> GameState {
-        GameState {
-            snapshot: GameStateSnapshot::from_game(&self.game),
+    fn state(&mut self, py: Python<'_>) -> PyResult<Py<GameState>> {
+        // GameState is a read-only snapshot, so the same object is handed
+        // out until the game changes rather than copying the game each read
+        if let Some((version, state)) = &self.cached_state {
+            if *version == self.state_version {
+                return Ok(state.clone_ref(py));
+            }
         }
+        let state = Py::new(
+            py,
+            GameState {
+                snapshot: GameStateSnapshot::from_game(&self.game),
+                joker_ids: GILOnceCell::new(),
+            },
+        )?;
+        self.cached_state = Some((self.state_version, state.clone_ref(py)));
+        Ok(state)
+    }
+
+    /// Cheap snapshot of the scalar game values and stage name as a
+    /// `LightweightGameState` named tuple, read in a single call. Fields are
+    /// plain Python values so reads stay in Python
+    #[getter]
+    fn lightweight_state<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        // All fields are read under the one shared borrow PyO3 holds for this
+        // call, and mutating methods need an exclusive borrow, so the
+        // snapshot is always consistent without any extra synchronisation
+        let game = &self.game;
+        lightweight_state_type(py)?.call1((
+            game.money,
+            game.chips,
+            game.mult,
+            game.score,
+            game.round,
+            game.plays,
+            game.discards,
+            stage_name(py, game.stage),
+        ))
     }
     #[getter]
     fn is_over(&self) -> bool {
@@ -813,55 +864,27 @@ impl GameEngine {
         false
     }
 
+    /// Game status packed into one int, for loops that poll it every move:
+    /// bit 0 is is_over, bit 1 is is_win and the bits above hold `Stage.int()`
+    fn status(&self) -> u8 {
+        (self.game.is_over() as u8)
+            | ((self.is_win() as u8) << 1)
+            | ((self.game.stage.int() as u8) << 2)
+    }
+
     /// Get all active joker states
     fn get_joker_states(&self) -> pyo3::PyObject {
         pyo3::Python::with_gil(|py| {
             let dict = pyo3::types::PyDict::new(py);
 
-            for joker in &self.game.jokers {
-                let joker_id = joker.id();
-                let state_dict = pyo3::types::PyDict::new(py);
-
-                // Get actual state from the joker state manager
-                if let Some(joker_state) = self.game.joker_state_manager.get_state(joker_id) {
-                    let _ = state_dict.set_item("accumulated_value", joker_state.accumulated_value);
-                    let _ =
-                        state_dict.set_item("triggers_remaining", joker_state.triggers_remaining);
-
-                    // Add custom data
-                    let custom_data_dict = pyo3::types::PyDict::new(py);
-                    for (key, value) in &joker_state.custom_data {
-                        let py_value = match value {
-                            serde_json::Value::Null => py.None(),
-                            serde_json::Value::Bool(b) => b.to_object(py),
-                            serde_json::Value::Number(n) => {
-                                if let Some(i) = n.as_i64() {
-                                    i.to_object(py)
-                                } else if let Some(f) = n.as_f64() {
-                                    f.to_object(py)
-                                } else {
-                                    py.None()
-                                }
-                            }
-                            serde_json::Value::String(s) => s.to_object(py),
-                            serde_json::Value::Array(_) | serde_json::Value::Object(_) => {
-                                serde_json::to_string(&value)
-                                    .unwrap_or_default()
-                                    .to_object(py)
-                            }
-                        };
-                        let _ = custom_data_dict.set_item(key, py_value);
-                    }
-                    let _ = state_dict.set_item("custom_data", custom_data_dict);
-                } else {
-                    // No state exists yet - return default values
-                    let _ = state_dict.set_item("accumulated_value", 0.0f64);
-                    let _ = state_dict.set_item("triggers_remaining", py.None());
-                    let _ = state_dict.set_item("custom_data", pyo3::types::PyDict::new(py));
+            // Read every state under one lock rather than cloning each one
+            self.game.joker_state_manager.with_states(|states| {
+                for joker in &self.game.jokers {
+                    let joker_id = joker.id();
+                    let state_dict = joker_state_dict(py, states.get(&joker_id));
+                    let _ = dict.set_item(format!("{joker_id:?}"), state_dict);
                 }
-
-                let _ = dict.set_item(format!("{joker_id:?}"), state_dict);
-            }
+            });
 
             dict.into()
         })
@@ -890,6 +913,32 @@ impl GameEngine {
         })
     }
 
+    /// Get accumulated values for all jokers as parallel sequences: a list of
+    /// joker ids and an `array.array('d')` of their values. The array
+    /// supports the buffer protocol so numpy can wrap it without copying
+    fn get_joker_accumulated_values_arrays<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> PyResult<(Vec<JokerId>, Bound<'py, PyAny>)> {
+        let jokers = &self.game.jokers;
+        let mut ids = Vec::with_capacity(jokers.len());
+        let mut values = Vec::with_capacity(jokers.len() * std::mem::size_of::<f64>());
+
+        for joker in jokers {
+            let joker_id = joker.id();
+            let accumulated_value = self
+                .game
+                .joker_state_manager
+                .get_accumulated_value(joker_id)
+                .unwrap_or(0.0); // Default value if no state exists
+            ids.push(joker_id);
+            values.extend_from_slice(&accumulated_value.to_ne_bytes());
+        }
+
+        let values = typed_array(py, intern!(py, "d"), &values)?;
+        Ok((ids, values))
+    }
+
     /// Get triggers remaining for all jokers
     fn get_joker_triggers_remaining(&self) -> pyo3::PyObject {
         pyo3::Python::with_gil(|py| {
@@ -912,11 +961,67 @@ impl GameEngine {
             dict.into()
         })
     }
+
+    /// Get triggers remaining for all jokers as parallel lists of ids and an
+    /// `array.array('i')` of counts, with -1 standing in for unlimited
+    fn get_joker_triggers_remaining_arrays<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> PyResult<(Vec<JokerId>, Bound<'py, PyAny>)> {
+        let jokers = &self.game.jokers;
+        let mut ids = Vec::with_capacity(jokers.len());
+        let mut values = Vec::with_capacity(jokers.len() * std::mem::size_of::<i32>());
+
+        self.game.joker_state_manager.with_states(|states| {
+            for joker in jokers {
+                let joker_id = joker.id();
+                // No state yet means no trigger limit
+                let triggers_remaining = states
+                    .get(&joker_id)
+                    .map_or(-1, JokerState::triggers_remaining_raw);
+                ids.push(joker_id);
+                values.extend_from_slice(&triggers_remaining.to_ne_bytes());
+            }
+        });
+
+        let values = typed_array(py, intern!(py, "i"), &values)?;
+        Ok((ids, values))
+    }
 }
 
-#[pyclass]
+// Frozen: GameState never changes after it is built, so reads skip the
+// runtime borrow check
+#[pyclass(frozen)]
 struct GameState {
     snapshot: GameStateSnapshot,
+    // JokerId objects for the snapshot, built on first read
+    joker_ids: GILOnceCell<Py<PyTuple>>,
+}
+
+impl GameState {
+    fn cached_joker_ids(&self, py: Python<'_>) -> PyResult<&Py<PyTuple>> {
+        self.joker_ids.get_or_try_init(py, || {
+            // Most states have no jokers, those get the shared empty tuple
+            // without touching (or building) the metadata cache
+            if self.snapshot.joker_ids.is_empty() {
+                return Ok(PyTuple::empty(py).unbind());
+            }
+            let cache = joker_metadata_cache(py)?;
+            let joker_ids = self
+                .snapshot
+                .joker_ids
+                .iter()
+                .map(|&joker_id| cache.joker_id_object(py, joker_id))
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyTuple::new(py, joker_ids)?.unbind())
+        })
+    }
+
+    fn legacy_jokers(&self) -> Vec<Jokers> {
+        // TODO: Convert new joker system to old Jokers enum for Python compatibility
+        // For now, return empty vector during migration
+        Vec::new()
+    }
 }
 
 #[pymethods]
@@ -937,6 +1042,19 @@ impl GameState {
     fn deck(&self) -> Vec<Card> {
         self.snapshot.deck_cards.clone()
     }
+    /// Deck packed one byte per card, the rank (`Value`, 0-12) in the low
+    /// nibble and the suit (`Suit`, 0-3) in the high nibble. Counting ranks
+    /// or suits from this avoids building a Card object per card
+    #[getter]
+    fn deck_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let deck = &self.snapshot.deck_cards;
+        PyBytes::new_with(py, deck.len(), |bytes| {
+            for (byte, card) in bytes.iter_mut().zip(deck) {
+                *byte = (card.suit as u8) << 4 | card.value as u8;
+            }
+            Ok(())
+        })
+    }
     #[getter]
     fn selected(&self) -> Vec<Card> {
         self.snapshot.selected_cards.clone()
@@ -969,30 +1087,68 @@ impl GameState {
     #[getter]
     fn jokers(&self) -> PyResult<Vec<Jokers>> {
         // Emit deprecation warning
+        // stacklevel 2 - show warning at caller's location
         Python::with_gil(|py| {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                (
-                    "GameState.jokers is deprecated. Use GameState.joker_ids with GameEngine.get_joker_info() instead. \
-                     The jokers property will be removed in a future version. \
-                     See migration guide for details.",
-                    py.get_type::<pyo3::exceptions::PyDeprecationWarning>(),
-                    2  // stacklevel - show warning at caller's location
-                ),
-            )?;
-            Ok::<(), PyErr>(())
+            warn::<PyDeprecationWarning>(
+                py,
+                c"GameState.jokers is deprecated. Use GameState.joker_ids with GameEngine.get_joker_info() instead. \
+                  The jokers property will be removed in a future version. \
+                  See migration guide for details.",
+                2,
+            )
         })?;
 
-        // TODO: Convert new joker system to old Jokers enum for Python compatibility
-        // For now, return empty vector during migration
-        Ok(Vec::new())
+        Ok(self.legacy_jokers())
+    }
+
+    /// JokerIds converted from the deprecated `jokers` list in one call, in
+    /// place of `[j.to_joker_id() for j in state.jokers]`
+    fn legacy_joker_ids(&self) -> Vec<JokerId> {
+        self.legacy_jokers()
+            .iter()
+            .map(Jokers::to_joker_id)
+            .collect()
+    }
+
+    /// JokerId discriminants as an `array.array('H')`, whole lists of ids
+    /// compare with a single `==` instead of one comparison per id
+    #[getter]
+    fn joker_id_codes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        joker_id_codes(py, &self.snapshot.joker_ids)
+    }
+
+    /// Same as joker_id_codes, for the ids converted from the deprecated
+    /// `jokers` list
+    fn legacy_joker_id_codes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        joker_id_codes(py, &self.legacy_joker_ids())
     }
 
     /// Get joker IDs using the new JokerId system
     #[getter]
-    fn joker_ids(&self) -> Vec<JokerId> {
-        self.snapshot.joker_ids.clone()
+    fn joker_ids<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        Ok(self.cached_joker_ids(py)?.bind(py).to_list())
+    }
+
+    /// Same as joker_ids, but as a tuple which is shared between reads
+    /// instead of a new list each time
+    #[getter]
+    fn joker_ids_tuple(&self, py: Python<'_>) -> PyResult<Py<PyTuple>> {
+        Ok(self.cached_joker_ids(py)?.clone_ref(py))
+    }
+
+    /// The joker fields read in a single call, as a
+    /// `(joker_ids, jokers, joker_slots_used, joker_slots_total)` tuple.
+    /// `jokers` is deprecated, so this warns the same way the getter does
+    fn snapshot<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> PyResult<(Bound<'py, PyList>, Vec<Jokers>, usize, usize)> {
+        Ok((
+            self.joker_ids(py)?,
+            self.jokers()?,
+            self.snapshot.joker_count,
+            self.snapshot.joker_slots_max,
+        ))
     }
 
     /// Get number of joker slots currently in use
@@ -1059,14 +1215,15 @@ impl GameState {
     fn gen_actions(&self) -> PyResult<Vec<Action>> {
         // Issue deprecation warning
         Python::with_gil(|py| -> PyResult<()> {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                ("GameState.gen_actions() is deprecated. Use GameEngine.gen_actions() instead. GameState should only be used for reading game state, not performing actions.",),
+            warn::<PyUserWarning>(
+                py,
+                c"GameState.gen_actions() is deprecated. Use GameEngine.gen_actions() instead. GameState should only be used for reading game state, not performing actions.",
+                1,
             )?;
-            warnings.call_method1(
-                "warn",
-                ("This method will be removed in version 2.0. Migration guide: https://github.com/spencerduncan/balatro-rs/wiki/Python-API-Migration",),
+            warn::<PyUserWarning>(
+                py,
+                c"This method will be removed in version 2.0. Migration guide: https://github.com/spencerduncan/balatro-rs/wiki/Python-API-Migration",
+                1,
             )?;
             Ok(())
         })?;
@@ -1082,10 +1239,10 @@ impl GameState {
     fn gen_action_space(&self) -> PyResult<Vec<usize>> {
         // Issue deprecation warning
         Python::with_gil(|py| -> PyResult<()> {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                ("GameState.gen_action_space() is deprecated. Use GameEngine.gen_action_space() instead. GameState should only be used for reading game state, not performing actions.",),
+            warn::<PyUserWarning>(
+                py,
+                c"GameState.gen_action_space() is deprecated. Use GameEngine.gen_action_space() instead. GameState should only be used for reading game state, not performing actions.",
+                1,
             )?;
             Ok(())
         })?;
@@ -1101,10 +1258,10 @@ impl GameState {
     fn get_action_name(&self, _index: usize) -> PyResult<String> {
         // Issue deprecation warning
         Python::with_gil(|py| -> PyResult<()> {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                ("GameState.get_action_name() is deprecated. Use GameEngine.get_action_name() instead. GameState should only be used for reading game state, not performing actions.",),
+            warn::<PyUserWarning>(
+                py,
+                c"GameState.get_action_name() is deprecated. Use GameEngine.get_action_name() instead. GameState should only be used for reading game state, not performing actions.",
+                1,
             )?;
             Ok(())
         })?;
@@ -1120,10 +1277,10 @@ impl GameState {
     fn handle_action(&self, _action: Action) -> PyResult<()> {
         // Issue deprecation warning and error
         Python::with_gil(|py| -> PyResult<()> {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                ("GameState.handle_action() is deprecated and cannot modify game state. Use GameEngine.handle_action() instead on a mutable GameEngine instance.",),
+            warn::<PyUserWarning>(
+                py,
+                c"GameState.handle_action() is deprecated and cannot modify game state. Use GameEngine.handle_action() instead on a mutable GameEngine instance.",
+                1,
             )?;
             Ok(())
         })?;
@@ -1138,10 +1295,10 @@ impl GameState {
     fn handle_action_index(&self, _index: usize) -> PyResult<()> {
         // Issue deprecation warning and error
         Python::with_gil(|py| -> PyResult<()> {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                ("GameState.handle_action_index() is deprecated and cannot modify game state. Use GameEngine.handle_action_index() instead on a mutable GameEngine instance.",),
+            warn::<PyUserWarning>(
+                py,
+                c"GameState.handle_action_index() is deprecated and cannot modify game state. Use GameEngine.handle_action_index() instead on a mutable GameEngine instance.",
+                1,
             )?;
             Ok(())
         })?;
@@ -1157,10 +1314,10 @@ impl GameState {
     fn is_over(&self) -> PyResult<bool> {
         // Issue deprecation warning
         Python::with_gil(|py| -> PyResult<()> {
-            let warnings = py.import("warnings")?;
-            warnings.call_method1(
-                "warn",
-                ("GameState.is_over is deprecated. Use GameEngine.is_over instead.",),
+            warn::<PyUserWarning>(
+                py,
+                c"GameState.is_over is deprecated. Use GameEngine.is_over instead.",
+                1,
             )?;
             Ok(())
         })?;
@@ -1168,14 +1325,395 @@ impl GameState {
         Ok(self.snapshot.is_over)
     }
 
-    fn __repr__(&self) -> String {
-        format!(
-            "GameState: Stage={:?}, Round={}, Score={}/{}",
-            self.snapshot.stage,
+    fn __repr__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        // Written into one buffer sized for the common case, the stage name
+        // comes from the static table rather than Debug formatting
+        let mut repr = String::with_capacity(64);
+        let _ = write!(
+            repr,
+            "GameState: Stage={}, Round={}, Score={}/{}",
+            STAGE_NAMES[self.snapshot.stage.int()],
             self.snapshot.round,
             self.snapshot.score,
             self.snapshot.required_score
-        )
+        );
+        PyString::new(py, &repr)
+    }
+}
+
+/// Stage names indexed by `Stage::int`, matching their `Debug` output
+const STAGE_NAMES: [&str; 8] = [
+    "PreBlind",
+    "Blind(Small)",
+    "Blind(Big)",
+    "Blind(Boss)",
+    "PostBlind",
+    "Shop",
+    "End(Win)",
+    "End(Lose)",
+];
+
+static STAGE_STRS: GILOnceCell<[Py<PyString>; 8]> = GILOnceCell::new();
+
+/// Interned Python string for a stage name, shared instead of allocating a
+/// new `str` each time the stage is reported
+fn stage_name(py: Python<'_>, stage: Stage) -> Bound<'_, PyString> {
+    STAGE_STRS.get_or_init(py, || {
+        STAGE_NAMES.map(|name| PyString::intern(py, name).unbind())
+    })[stage.int()]
+    .bind(py)
+    .clone()
+}
+
+/// An `array.array` of `typecode` over native-endian `bytes`
+fn typed_array<'py>(
+    py: Python<'py>,
+    typecode: &Bound<'py, PyString>,
+    bytes: &[u8],
+) -> PyResult<Bound<'py, PyAny>> {
+    let array = py
+        .import(intern!(py, "array"))?
+        .getattr(intern!(py, "array"))?;
+    array.call1((typecode, PyBytes::new(py, bytes)))
+}
+
+/// JokerId discriminants as an `array.array('H')`
+fn joker_id_codes<'py>(py: Python<'py>, joker_ids: &[JokerId]) -> PyResult<Bound<'py, PyAny>> {
+    let bytes: Vec<u8> = joker_ids
+        .iter()
+        .flat_map(|&joker_id| (joker_id as u16).to_ne_bytes())
+        .collect();
+    typed_array(py, intern!(py, "H"), &bytes)
+}
+
+static LIGHTWEIGHT_STATE_TYPE: GILOnceCell<Py<PyAny>> = GILOnceCell::new();
+
+/// The `LightweightGameState` named tuple type, created once per interpreter
+fn lightweight_state_type(py: Python<'_>) -> PyResult<&Bound<'_, PyAny>> {
+    LIGHTWEIGHT_STATE_TYPE
+        .get_or_try_init(py, || {
+            let namedtuple = py.import("collections")?.getattr("namedtuple")?;
+            Ok::<_, PyErr>(
+                namedtuple
+                    .call1((
+                        "LightweightGameState",
+                        "money chips mult score round plays_remaining discards_remaining stage",
+                    ))?
+                    .unbind(),
+            )
+        })
+        .map(|cls| cls.bind(py))
+}
+
+/// Emit a warning of category `T` through the C warnings API, avoiding a
+/// `warnings` module import and Python-level call on every deprecated access
+fn warn<T: PyTypeInfo>(py: Python<'_>, message: &CStr, stacklevel: i32) -> PyResult<()> {
+    PyErr::warn(py, T::type_object(py).as_any(), message, stacklevel)
+}
+
+/// Python objects for one registered joker: its properties dict and its
+/// metadata built for both unlock states, so lookups only need to evaluate
+/// the unlock condition
+struct CachedJokerMetadata {
+    key: Py<JokerId>,
+    properties: Py<PyDict>,
+    effect_info: Py<PyDict>,
+    /// `types.MappingProxyType` views handed out without copying
+    properties_view: Py<PyAny>,
+    effect_info_view: Py<PyAny>,
+    unlock_condition: Option<UnlockCondition>,
+    /// `Debug` text of `unlock_condition`, or None
+    unlock_condition_repr: Py<PyAny>,
+    locked: Py<JokerMetadata>,
+    unlocked: Py<JokerMetadata>,
+}
+
+impl CachedJokerMetadata {
+    fn is_unlocked(&self, game: &Game) -> bool {
+        self.unlock_condition
+            .as_ref()
+            .map(|condition| evaluate_unlock_condition(condition, game))
+            .unwrap_or(true) // No unlock condition means always unlocked
+    }
+
+    /// The metadata object matching the joker's unlock state in `game`
+    fn for_game(&self, py: Python<'_>, game: &Game) -> Py<JokerMetadata> {
+        if self.is_unlocked(game) {
+            self.unlocked.clone_ref(py)
+        } else {
+            self.locked.clone_ref(py)
+        }
+    }
+}
+
+/// Joker metadata for the whole registry in registry order. The fields
+/// filters scan are kept as separate columns parallel to `entries`
+struct JokerMetadataCache {
+    entries: Vec<CachedJokerMetadata>,
+    definitions: Vec<Py<JokerDefinition>>,
+    costs: Vec<i32>,
+    names_lower: Vec<Box<str>>,
+    descriptions_lower: Vec<Box<str>>,
+    by_rarity: [Vec<usize>; 4],
+    /// `definitions` as a tuple, and split into one tuple per rarity slot
+    all_definitions: Py<PyTuple>,
+    definitions_by_rarity: Vec<Py<PyTuple>>,
+    /// Entries with an unlock condition, every other joker is always unlocked
+    conditional: Vec<usize>,
+    /// Entry position by `JokerId` discriminant, a direct load instead of
+    /// hashing the id
+    index: Vec<Option<usize>>,
+}
+
+impl JokerMetadataCache {
+    fn position(&self, joker_id: JokerId) -> Option<usize> {
+        self.index.get(joker_id as usize).copied().flatten()
+    }
+
+    fn get(&self, joker_id: JokerId) -> Option<&CachedJokerMetadata> {
+        self.position(joker_id).map(|i| &self.entries[i])
+    }
+
+    /// Python object for `joker_id`. JokerId is frozen, so registered ids
+    /// share the cached object instead of allocating a new one each time
+    fn joker_id_object(&self, py: Python<'_>, joker_id: JokerId) -> PyResult<Py<JokerId>> {
+        match self.get(joker_id) {
+            Some(cached) => Ok(cached.key.clone_ref(py)),
+            None => Py::new(py, joker_id),
+        }
+    }
+
+    /// Number of jokers unlocked in `game`, only conditional entries are
+    /// evaluated
+    fn unlocked_count(&self, game: &Game) -> usize {
+        let locked = self
+            .conditional
+            .iter()
+            .filter(|&&i| !self.entries[i].is_unlocked(game))
+            .count();
+        self.entries.len() - locked
+    }
+
+    /// Entry indices from `candidates` passing the requested filters. Each
+    /// combination of flags gets its own monomorphized loop so only the
+    /// checks that were asked for run per joker
+    fn filter_indices<I: Iterator<Item = usize>>(
+        &self,
+        candidates: I,
+        game: &Game,
+        unlocked_only: bool,
+        affordable_only: bool,
+    ) -> Vec<usize> {
+        match (unlocked_only, affordable_only) {
+            (false, false) => candidates.collect(),
+            (true, false) => self.filter_by::<I, true, false>(candidates, game),
+            (false, true) => self.filter_by::<I, false, true>(candidates, game),
+            (true, true) => self.filter_by::<I, true, true>(candidates, game),
+        }
+    }
+
+    fn filter_by<
+        I: Iterator<Item = usize>,
+        const UNLOCKED_ONLY: bool,
+        const AFFORDABLE_ONLY: bool,
+    >(
+        &self,
+        candidates: I,
+        game: &Game,
+    ) -> Vec<usize> {
+        candidates
+            .filter(|&i| {
+                // Filter by unlock status if requested
+                (!UNLOCKED_ONLY || self.entries[i].is_unlocked(game))
+                    // Filter by affordability if requested
+                    && (!AFFORDABLE_ONLY || game.money >= self.costs[i] as f64)
+            })
+            .collect()
+    }
+}
+
+static JOKER_METADATA_CACHE: GILOnceCell<JokerMetadataCache> = GILOnceCell::new();
+
+/// Registry metadata is read-only once the module is loaded, so the Python
+/// objects are built on first use and shared by every engine afterwards
+fn joker_metadata_cache(py: Python<'_>) -> PyResult<&JokerMetadataCache> {
+    JOKER_METADATA_CACHE.get_or_try_init(py, || {
+        let definitions = registry::all_definitions()?;
+        let mut entries = Vec::with_capacity(definitions.len());
+        let mut definition_objects = Vec::with_capacity(definitions.len());
+        let mut costs = Vec::with_capacity(definitions.len());
+        let mut names_lower = Vec::with_capacity(definitions.len());
+        let mut descriptions_lower = Vec::with_capacity(definitions.len());
+        let mut by_rarity: [Vec<usize>; 4] = Default::default();
+        let mut conditional = Vec::new();
+        let index_len = definitions
+            .iter()
+            .map(|d| d.id as usize + 1)
+            .max()
+            .unwrap_or(0);
+        let mut index = vec![None; index_len];
+        let mapping_proxy = py
+            .import(intern!(py, "types"))?
+            .getattr(intern!(py, "MappingProxyType"))?;
+        for definition in definitions {
+            let properties = PyDict::new(py);
+            properties.set_item(intern!(py, "name"), &definition.name)?;
+            properties.set_item(intern!(py, "description"), &definition.description)?;
+            properties.set_item(
+                intern!(py, "rarity"),
+                PyString::intern(py, definition.rarity.name()),
+            )?;
+            properties.set_item(intern!(py, "cost"), calculate_joker_cost(definition.rarity))?;
+
+            let (effect_type, triggers_on) = joker_effect_kind(definition.id);
+            let effect_info = PyDict::new(py);
+            effect_info.set_item(
+                intern!(py, "effect_type"),
+                PyString::intern(py, effect_type),
+            )?;
+            effect_info.set_item(intern!(py, "description"), &definition.description)?;
+            let parameters = extract_joker_parameters(definition.id, py);
+            effect_info.set_item(intern!(py, "parameters"), &parameters)?;
+            let triggers_on: Vec<_> = triggers_on
+                .iter()
+                .map(|trigger| PyString::intern(py, trigger))
+                .collect();
+            effect_info.set_item(intern!(py, "triggers_on"), PyList::new(py, &triggers_on)?)?;
+
+            // Read-only views share the cached data, nested containers are
+            // frozen too so nothing reachable from a view can be modified
+            let properties_view = mapping_proxy.call1((&properties,))?;
+            let frozen_effect_info = effect_info.copy()?;
+            frozen_effect_info.set_item(
+                intern!(py, "parameters"),
+                mapping_proxy.call1((parameters,))?,
+            )?;
+            frozen_effect_info.set_item(
+                intern!(py, "triggers_on"),
+                PyFrozenSet::new(py, triggers_on)?,
+            )?;
+            let effect_info_view = mapping_proxy.call1((frozen_effect_info,))?;
+
+            let unlock_condition_repr = match &definition.unlock_condition {
+                Some(condition) => PyString::new(py, &format!("{condition:?}")).into_any(),
+                None => py.None().into_bound(py),
+            };
+
+            index[definition.id as usize] = Some(entries.len());
+            by_rarity[rarity_slot(definition.rarity)].push(entries.len());
+            if definition.unlock_condition.is_some() {
+                conditional.push(entries.len());
+            }
+            costs.push(calculate_joker_cost(definition.rarity));
+            names_lower.push(definition.name.to_lowercase().into_boxed_str());
+            descriptions_lower.push(definition.description.to_lowercase().into_boxed_str());
+            definition_objects.push(Py::new(py, definition.clone())?);
+            entries.push(CachedJokerMetadata {
+                key: Py::new(py, definition.id)?,
+                properties: properties.unbind(),
+                effect_info: effect_info.unbind(),
+                properties_view: properties_view.unbind(),
+                effect_info_view: effect_info_view.unbind(),
+                unlock_condition_repr: unlock_condition_repr.unbind(),
+                locked: Py::new(py, JokerMetadata::from_definition(&definition, false))?,
+                unlocked: Py::new(py, JokerMetadata::from_definition(&definition, true))?,
+                unlock_condition: definition.unlock_condition,
+            });
+        }
+        let all_definitions =
+            PyTuple::new(py, definition_objects.iter().map(|d| d.clone_ref(py)))?.unbind();
+        let definitions_by_rarity = by_rarity
+            .iter()
+            .map(|slots| {
+                let definitions = slots.iter().map(|&i| definition_objects[i].clone_ref(py));
+                Ok(PyTuple::new(py, definitions)?.unbind())
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok::<_, PyErr>(JokerMetadataCache {
+            entries,
+            definitions: definition_objects,
+            costs,
+            names_lower,
+            descriptions_lower,
+            by_rarity,
+            all_definitions,
+            definitions_by_rarity,
+            conditional,
+            index,
+        })
+    })
+}
+
+/// Fixed joker groupings returned by `get_joker_categories`
+const JOKER_CATEGORIES: [(&str, &[JokerId]); 2] = [
+    ("Basic Scoring", &[JokerId::Joker]),
+    (
+        "Suit-based",
+        &[
+            JokerId::GreedyJoker,
+            JokerId::LustyJoker,
+            JokerId::WrathfulJoker,
+            JokerId::GluttonousJoker,
+        ],
+    ),
+];
+
+/// Position of a rarity in `JokerMetadataCache::by_rarity`
+fn rarity_slot(rarity: JokerRarity) -> usize {
+    match rarity {
+        JokerRarity::Common => 0,
+        JokerRarity::Uncommon => 1,
+        JokerRarity::Rare => 2,
+        JokerRarity::Legendary => 3,
+    }
+}
+
+/// Convert a joker's state into the dict handed to python, falling back to
+/// default values when no state exists yet
+fn joker_state_dict<'py>(py: Python<'py>, joker_state: Option<&JokerState>) -> Bound<'py, PyDict> {
+    let state_dict = PyDict::new(py);
+    if let Some(joker_state) = joker_state {
+        let _ = state_dict.set_item(
+            intern!(py, "accumulated_value"),
+            joker_state.accumulated_value,
+        );
+        let _ = state_dict.set_item(
+            intern!(py, "triggers_remaining"),
+            joker_state.triggers_remaining,
+        );
+
+        // Add custom data
+        let custom_data_dict = PyDict::new(py);
+        for (key, value) in &joker_state.custom_data {
+            let _ = custom_data_dict.set_item(key, json_to_py(py, value));
+        }
+        let _ = state_dict.set_item(intern!(py, "custom_data"), custom_data_dict);
+    } else {
+        let _ = state_dict.set_item(intern!(py, "accumulated_value"), 0.0f64);
+        let _ = state_dict.set_item(intern!(py, "triggers_remaining"), py.None());
+        let _ = state_dict.set_item(intern!(py, "custom_data"), PyDict::new(py));
+    }
+    state_dict
+}
+
+/// Convert a custom data value to python, nested values become JSON strings
+fn json_to_py(py: Python<'_>, value: &serde_json::Value) -> pyo3::PyObject {
+    match value {
+        serde_json::Value::Null => py.None(),
+        serde_json::Value::Bool(b) => b.to_object(py),
+        serde_json::Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.to_object(py)
+            } else if let Some(f) = n.as_f64() {
+                f.to_object(py)
+            } else {
+                py.None()
+            }
+        }
+        serde_json::Value::String(s) => s.to_object(py),
+        serde_json::Value::Array(_) | serde_json::Value::Object(_) => serde_json::to_string(value)
+            .unwrap_or_default()
+            .to_object(py),
     }
 }
 
@@ -1219,6 +1757,39 @@ fn evaluate_unlock_condition(condition: &UnlockCondition, game: &Game) -> bool {
 
 // calculate_joker_cost function moved to core/src/joker_registry.rs to avoid duplication
 
+/// Effect type and trigger names reported by `get_joker_effect_info`
+fn joker_effect_kind(joker_id: JokerId) -> (&'static str, &'static [&'static str]) {
+    match joker_id {
+        JokerId::Joker => ("Basic Mult", &["hand_played"]),
+        JokerId::GreedyJoker
+        | JokerId::LustyJoker
+        | JokerId::WrathfulJoker
+        | JokerId::GluttonousJoker => ("Conditional Mult", &["card_scored"]),
+        _ => ("Effect", &[]),
+    }
+}
+
+/// Copy a cached effect info dict along with the parameters dict and
+/// triggers list inside it, so callers can't modify the shared objects
+fn copy_effect_info<'py>(effect_info: &Bound<'py, PyDict>) -> PyResult<Bound<'py, PyDict>> {
+    let py = effect_info.py();
+    let dict = effect_info.copy()?;
+    if let Some(parameters) = dict.get_item(intern!(py, "parameters"))? {
+        dict.set_item(
+            intern!(py, "parameters"),
+            parameters.downcast::<PyDict>()?.copy()?,
+        )?;
+    }
+    if let Some(triggers_on) = dict.get_item(intern!(py, "triggers_on"))? {
+        let triggers_on = triggers_on.downcast::<PyList>()?;
+        dict.set_item(
+            intern!(py, "triggers_on"),
+            triggers_on.get_slice(0, triggers_on.len()),
+        )?;
+    }
+    Ok(dict)
+}
+
 /// Extract joker parameters based on joker implementation type
 fn extract_joker_parameters(joker_id: JokerId, py: pyo3::Python) -> pyo3::PyObject {
     let dict = pyo3::types::PyDict::new(py);
@@ -1226,32 +1797,32 @@ fn extract_joker_parameters(joker_id: JokerId, py: pyo3::Python) -> pyo3::PyObje
     match joker_id {
         JokerId::Joker => {
             // Basic joker gives +4 mult
-            let _ = dict.set_item("mult_bonus", 4);
+            let _ = dict.set_item(intern!(py, "mult_bonus"), 4);
         }
         JokerId::GreedyJoker => {
             // +3 mult for each diamond card scored
-            let _ = dict.set_item("mult_per_diamond", 3);
-            let _ = dict.set_item("target_suit", "Diamond");
+            let _ = dict.set_item(intern!(py, "mult_per_diamond"), 3);
+            let _ = dict.set_item(intern!(py, "target_suit"), intern!(py, "Diamond"));
         }
         JokerId::LustyJoker => {
             // +3 mult for each heart card scored
-            let _ = dict.set_item("mult_per_heart", 3);
-            let _ = dict.set_item("target_suit", "Heart");
+            let _ = dict.set_item(intern!(py, "mult_per_heart"), 3);
+            let _ = dict.set_item(intern!(py, "target_suit"), intern!(py, "Heart"));
         }
         JokerId::WrathfulJoker => {
             // +3 mult for each spade card scored
-            let _ = dict.set_item("mult_per_spade", 3);
-            let _ = dict.set_item("target_suit", "Spade");
+            let _ = dict.set_item(intern!(py, "mult_per_spade"), 3);
+            let _ = dict.set_item(intern!(py, "target_suit"), intern!(py, "Spade"));
         }
         JokerId::GluttonousJoker => {
             // +3 mult for each club card scored
-            let _ = dict.set_item("mult_per_club", 3);
-            let _ = dict.set_item("target_suit", "Club");
+            let _ = dict.set_item(intern!(py, "mult_per_club"), 3);
+            let _ = dict.set_item(intern!(py, "target_suit"), intern!(py, "Club"));
         }
         JokerId::Runner => {
             // +15 chips accumulated when straight is played
-            let _ = dict.set_item("chips_per_straight", 15);
-            let _ = dict.set_item("scaling_type", "accumulated");
+            let _ = dict.set_item(intern!(py, "chips_per_straight"), 15);
+            let _ = dict.set_item(intern!(py, "scaling_type"), intern!(py, "accumulated"));
         }
         _ => {
             // Default empty parameters for unspecified jokers
@@ -1261,6 +1832,142 @@ fn extract_joker_parameters(joker_id: JokerId, py: pyo3::Python) -> pyo3::PyObje
     dict.into()
 }
 
+/// Apply one legal action chosen uniformly at random. Returns false, leaving
+/// the game unchanged, when no action is legal
+fn step_random<R: Rng + ?Sized>(game: &mut Game, rng: &mut R) -> Result<bool, GameError> {
+    // The mask is walked in place twice rather than copied into a vec
+    let space = game.gen_action_space();
+    let count = space.iter().filter(|&valid| valid == 1).count();
+    if count == 0 {
+        return Ok(false);
+    }
+    // Walk to the chosen legal index rather than collecting all of them
+    let (index, _) = space
+        .iter()
+        .enumerate()
+        .filter(|&(_, valid)| valid == 1)
+        .nth(rng.gen_range(0..count))
+        .expect("chosen index is below the legal action count");
+    game.handle_action_index(index)?;
+    Ok(true)
+}
+
+/// Play the game to completion choosing uniformly among legal actions,
+/// returning the number of actions taken
+fn play_random<R: Rng + ?Sized>(game: &mut Game, rng: &mut R) -> Result<usize, GameError> {
+    let mut moves = 0;
+    // Stops early if no legal actions are left, nothing more can happen
+    while !game.is_over() && step_random(game, rng)? {
+        moves += 1;
+    }
+    Ok(moves)
+}
+
+/// Reset the game and run one random playout, returning (is_win, score)
+fn run_random_rollout(game: &mut Game) -> Result<(bool, f64), GameError> {
+    game.reset_game();
+    play_random(game, &mut rand::thread_rng())?;
+    Ok((game.result() == Some(End::Win), game.score))
+}
+
+/// Play a full game with random legal actions without leaving Rust, with
+/// the GIL released. Returns a tuple of (is_win, score)
+#[pyfunction]
+#[pyo3(signature = (config=None))]
+fn random_rollout(py: Python<'_>, config: Option<Config>) -> Result<(bool, f64), GameError> {
+    let config = config.unwrap_or_default();
+    py.allow_threads(|| run_random_rollout(&mut Game::new(config)))
+}
+
+/// Play `n` random games with the GIL released, returning parallel lists
+/// of wins and scores
+#[pyfunction]
+#[pyo3(signature = (config=None, n=1))]
+fn batch_random_rollout(
+    py: Python<'_>,
+    config: Option<Config>,
+    n: usize,
+) -> Result<(Vec<bool>, Vec<f64>), GameError> {
+    let config = config.unwrap_or_default();
+    py.allow_threads(|| {
+        // One game is reset between rollouts rather than reallocated
+        let mut game = Game::new(config);
+        let mut wins = Vec::with_capacity(n);
+        let mut scores = Vec::with_capacity(n);
+        for _ in 0..n {
+            let (win, score) = run_random_rollout(&mut game)?;
+            wins.push(win);
+            scores.push(score);
+        }
+        Ok::<_, GameError>((wins, scores))
+    })
+}
+
+/// Play `n` random games across a thread pool with the GIL released
+/// `threads=0` uses one thread per available core
+#[pyfunction]
+#[pyo3(signature = (config=None, n=1, threads=0))]
+fn parallel_rollouts(
+    py: Python<'_>,
+    config: Option<Config>,
+    n: usize,
+    threads: usize,
+) -> PyResult<(Vec<bool>, Vec<f64>)> {
+    let config = config.unwrap_or_default();
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(threads)
+        .build()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+    let results: Result<Vec<(bool, f64)>, GameError> = py.allow_threads(|| {
+        pool.install(|| {
+            (0..n)
+                .into_par_iter()
+                // Each worker reuses its own game between rollouts
+                .map_init(
+                    || Game::new(config.clone()),
+                    |game, _| run_random_rollout(game),
+                )
+                .collect()
+        })
+    });
+
+    Ok(results?.into_iter().unzip())
+}
+
+/// Build the caches the bindings otherwise create on first use (joker
+/// metadata, the lightweight state type) and run the common engine calls
+/// and joker getters once, so benchmarks don't time that cold start.
+/// The first timed run of a benchmark should still be discarded
+#[pyfunction]
+fn warmup(py: Python<'_>) -> PyResult<()> {
+    joker_metadata_cache(py)?;
+    lightweight_state_type(py)?;
+    py.import(intern!(py, "array"))?;
+
+    let mut engine = GameEngine::new(None);
+    engine.state(py)?.get().joker_ids(py)?;
+    engine.gen_action_space(py);
+    let space = engine.gen_action_space_bytes(py)?;
+    engine.get_available_jokers(py, None)?;
+
+    let joker_id = JokerId::Joker;
+    engine.get_joker_info(joker_id)?;
+    engine.get_joker_cost(py, joker_id)?;
+    engine.get_joker_metadata(py, joker_id)?;
+    engine.get_joker_properties(py, joker_id);
+    engine.get_joker_effect_info(py, joker_id);
+    engine.get_joker_unlock_status(py, joker_id);
+
+    // Take one legal action so the step path and the state rebuild after
+    // it are warm too
+    if let Some(index) = space.as_bytes().iter().position(|&legal| legal == 1) {
+        engine.handle_action_index(py, index)?;
+        engine.state(py)?;
+    }
+    Ok(())
+}
+
 #[pymodule]
 fn pylatro(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Config>()?;
@@ -1276,5 +1983,10 @@ fn pylatro(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<UnlockCondition>()?;
     m.add_class::<JokerMetadata>()?;
 
+    m.add_function(wrap_pyfunction!(random_rollout, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_random_rollout, m)?)?;
+    m.add_function(wrap_pyfunction!(parallel_rollouts, m)?)?;
+    m.add_function(wrap_pyfunction!(warmup, m)?)?;
+
     Ok(())
 }
@@ -16,7 +16,7 @@ def test_action_space():
         # Vector is masked, invalid actions are 0, valid are 1.
         # We only want to execute valid actions.
         while True:
-            index = random.choice(range(len(action_space)))
+            index = random.randrange(len(action_space))
             if action_space[index] == 1:
                 game.handle_action_index(index)
                 break
@@ -21,43 +21,41 @@ def test_read_only_deprecated_methods():
     
     # Test gen_actions (should work with warning)
     print("\n1. Testing GameState.gen_actions()...")
-    with warnings.catch_warnings(record=True) as w:
+    # One recording context per test, cleared between checks
+    with warnings.catch_warnings(record=True) as recorded:
         warnings.simplefilter("always")
         actions = state.gen_actions()
         print(f"   Actions generated: {len(actions)}")
-        if w:
-            print(f"   Deprecation warning: {w[0].message}")
+        if recorded:
+            print(f"   Deprecation warning: {recorded[0].message}")
     
-    # Test gen_action_space (should work with warning)
-    print("\n2. Testing GameState.gen_action_space()...")
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+        # Test gen_action_space (should work with warning)
+        print("\n2. Testing GameState.gen_action_space()...")
+        recorded.clear()
         action_space = state.gen_action_space()
         print(f"   Action space size: {len(action_space)}")
-        if w:
-            print(f"   Deprecation warning: {w[0].message}")
+        if recorded:
+            print(f"   Deprecation warning: {recorded[0].message}")
     
-    # Test get_action_name (should work with warning)
-    print("\n3. Testing GameState.get_action_name()...")
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+        # Test get_action_name (should work with warning)
+        print("\n3. Testing GameState.get_action_name()...")
+        recorded.clear()
         try:
             if len(action_space) > 0:
                 action_name = state.get_action_name(0)
                 print(f"   Action name for index 0: {action_name}")
         except RuntimeError as e:
             print(f"   Game logic error (expected): {e}")
-        if w:
-            print(f"   Deprecation warning: {w[0].message}")
+        if recorded:
+            print(f"   Deprecation warning: {recorded[0].message}")
     
-    # Test is_over property (should work with warning)
-    print("\n4. Testing GameState.is_over property...")
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+        # Test is_over property (should work with warning)
+        print("\n4. Testing GameState.is_over property...")
+        recorded.clear()
         is_over = state.is_over
         print(f"   Game is over: {is_over}")
-        if w:
-            print(f"   Deprecation warning: {w[0].message}")
+        if recorded:
+            print(f"   Deprecation warning: {recorded[0].message}")
 
 def test_mutating_deprecated_methods():
     """Test deprecated mutating methods on GameState (should fail)."""
@@ -70,7 +68,8 @@ def test_mutating_deprecated_methods():
     
     # Test handle_action (should fail with warning)
     print("\n1. Testing GameState.handle_action()...")
-    with warnings.catch_warnings(record=True) as w:
+    # One recording context per test, cleared between checks
+    with warnings.catch_warnings(record=True) as recorded:
         warnings.simplefilter("always")
         try:
             if actions:
@@ -78,20 +77,19 @@ def test_mutating_deprecated_methods():
                 print("   ERROR: handle_action should have failed!")
         except RuntimeError as e:
             print(f"   Expected error: {e}")
-        if w:
-            print(f"   Deprecation warning: {w[0].message}")
+        if recorded:
+            print(f"   Deprecation warning: {recorded[0].message}")
     
-    # Test handle_action_index (should fail with warning)
-    print("\n2. Testing GameState.handle_action_index()...")
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+        # Test handle_action_index (should fail with warning)
+        print("\n2. Testing GameState.handle_action_index()...")
+        recorded.clear()
         try:
             state.handle_action_index(0)
             print("   ERROR: handle_action_index should have failed!")
         except RuntimeError as e:
             print(f"   Expected error: {e}")
-        if w:
-            print(f"   Deprecation warning: {w[0].message}")
+        if recorded:
+            print(f"   Deprecation warning: {recorded[0].message}")
 
 def test_new_api_still_works():
     """Test that the new API on GameEngine still works correctly."""
@@ -101,12 +99,13 @@ def test_new_api_still_works():
     
     # Test that GameEngine methods work without warnings
     print("\n1. Testing GameEngine.gen_actions()...")
-    with warnings.catch_warnings(record=True) as w:
+    # One recording context per test, cleared between checks
+    with warnings.catch_warnings(record=True) as recorded:
         warnings.simplefilter("always")
         actions = engine.gen_actions()
         print(f"   Actions generated: {len(actions)}")
-        if w:
-            print(f"   Unexpected warning: {w[0].message}")
+        if recorded:
+            print(f"   Unexpected warning: {recorded[0].message}")
         else:
             print("   No warnings (as expected)")
     
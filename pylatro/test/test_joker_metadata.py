@@ -88,6 +88,29 @@ class TestJokerMetadataAccess:
         assert isinstance(effect_info['effect_type'], str)
         assert isinstance(effect_info['description'], str)
         assert isinstance(effect_info['triggers_on'], list)
+        
+        # Returned dicts are copies of the cached ones
+        effect_info['triggers_on'].append('modified')
+        effect_info['parameters']['modified'] = True
+        fresh = self.game.get_joker_effect_info(self.test_joker_id)
+        assert 'modified' not in fresh['triggers_on']
+        assert 'modified' not in fresh['parameters']
+    
+    def test_get_joker_info_views(self):
+        """Test read-only views over the cached properties and effect info"""
+        properties = self.game.get_joker_properties_view(self.test_joker_id)
+        effect_info = self.game.get_joker_effect_info_view(self.test_joker_id)
+        
+        assert dict(properties) == self.game.get_joker_properties(self.test_joker_id)
+        assert effect_info['effect_type'] == self.game.get_joker_effect_info(self.test_joker_id)['effect_type']
+        assert isinstance(effect_info['triggers_on'], frozenset)
+        assert effect_info['triggers_on'] == set(self.game.get_joker_effect_info(self.test_joker_id)['triggers_on'])
+        # Views are shared and can't be modified
+        assert self.game.get_joker_properties_view(self.test_joker_id) is properties
+        with pytest.raises(TypeError):
+            properties['name'] = 'modified'
+        with pytest.raises(TypeError):
+            effect_info['parameters']['modified'] = True
     
     def test_get_joker_unlock_status(self):
         """Test unlock condition and status access"""
@@ -183,13 +206,39 @@ class TestBatchJokerOperations:
         assert len(metadata_dict) == len(test_ids)
         
         for joker_id in test_ids:
-            joker_id_str = str(joker_id).replace('JokerId.', '')  # Convert to string format
-            assert joker_id_str in metadata_dict
-            metadata = metadata_dict[joker_id_str]
+            assert joker_id in metadata_dict
+            metadata = metadata_dict[joker_id]
             assert hasattr(metadata, 'name')
             assert hasattr(metadata, 'rarity')
             assert hasattr(metadata, 'cost')
     
+    def test_get_multiple_joker_metadata_list(self):
+        """Test batch metadata retrieval as an ordered list"""
+        test_ids = [joker.id for joker in self.all_jokers[:3]]
+
+        metadata_list = self.game.get_multiple_joker_metadata_list(test_ids[::-1])
+        metadata_dict = self.game.get_multiple_joker_metadata(test_ids)
+
+        assert isinstance(metadata_list, list)
+        assert len(metadata_list) == len(test_ids)
+        for joker_id, metadata in zip(test_ids[::-1], metadata_list):
+            assert metadata.id == joker_id
+            # Both forms hand out the same cached objects
+            assert metadata is metadata_dict[joker_id]
+    
+    def test_get_joker_infos_and_costs(self):
+        """Test batch definition and cost lookups"""
+        test_ids = [joker.id for joker in self.all_jokers[:3]]
+
+        infos = self.game.get_joker_infos(test_ids)
+        costs = self.game.get_joker_costs(test_ids)
+
+        assert len(infos) == len(costs) == len(test_ids)
+        for joker_id, info, cost in zip(test_ids, infos, costs):
+            assert info.id == joker_id
+            assert info.name == self.game.get_joker_info(joker_id).name
+            assert cost == self.game.get_joker_cost(joker_id)
+    
     def test_get_all_joker_metadata(self):
         """Test getting metadata for all jokers in registry"""
         all_metadata = self.game.get_all_joker_metadata()
@@ -199,9 +248,8 @@ class TestBatchJokerOperations:
         
         # Should include all available jokers
         for joker_def in self.all_jokers:
-            joker_id_str = str(joker_def.id).replace('JokerId.', '')  # Convert to string format
-            assert joker_id_str in all_metadata
-            metadata = all_metadata[joker_id_str]
+            assert joker_def.id in all_metadata
+            metadata = all_metadata[joker_def.id]
             assert metadata.name == joker_def.name
             assert metadata.description == joker_def.description
     
@@ -214,6 +262,13 @@ class TestBatchJokerOperations:
         for joker_metadata in common_jokers:
             assert hasattr(joker_metadata, 'rarity')
             assert joker_metadata.rarity == pylatro.JokerRarity.Common
+
+        # include_metadata is deprecated, the result is the same either way
+        with pytest.warns(DeprecationWarning):
+            minimal = self.game.get_jokers_by_rarity(
+                pylatro.JokerRarity.Common, include_metadata=False
+            )
+        assert [m.id for m in minimal] == [m.id for m in common_jokers]
     
     def test_get_unlocked_jokers_metadata(self):
         """Test getting metadata for unlocked jokers only"""
@@ -306,6 +361,8 @@ class TestJokerAnalysisUtilities:
         assert isinstance(stats['total_jokers'], int)
         assert isinstance(stats['by_rarity'], dict)
         assert isinstance(stats['unlocked_count'], int)
+        assert sum(stats['by_rarity'].values()) == stats['total_jokers']
+        assert 0 <= stats['unlocked_count'] <= stats['total_jokers']
     
     def test_analyze_joker_synergies(self):
         """Test joker synergy analysis"""
@@ -344,6 +401,17 @@ class TestEnhancedGameStateProperties:
         for joker_id, value in accumulated_values.items():
             assert isinstance(value, float)
     
+    def test_get_joker_accumulated_values_arrays(self):
+        """Test getting accumulated values as parallel id and value arrays"""
+        joker_ids, values = self.game.get_joker_accumulated_values_arrays()
+        
+        assert isinstance(joker_ids, list)
+        assert values.typecode == 'd'
+        assert len(joker_ids) == len(values)
+        accumulated_values = self.game.get_joker_accumulated_values()
+        for joker_id, value in zip(joker_ids, values):
+            assert accumulated_values[joker_id.name] == value
+    
     def test_get_joker_triggers_remaining(self):
         """Test getting triggers remaining for all jokers"""
         triggers = self.game.get_joker_triggers_remaining()
@@ -352,6 +420,19 @@ class TestEnhancedGameStateProperties:
         # Each key should be a JokerId, each value an int or None
         for joker_id, trigger_count in triggers.items():
             assert trigger_count is None or isinstance(trigger_count, int)
+    
+    def test_get_joker_triggers_remaining_arrays(self):
+        """Test getting triggers remaining as parallel id and count arrays"""
+        joker_ids, counts = self.game.get_joker_triggers_remaining_arrays()
+        
+        assert isinstance(joker_ids, list)
+        assert counts.typecode == 'i'
+        assert len(joker_ids) == len(counts)
+        triggers = self.game.get_joker_triggers_remaining()
+        for joker_id, count in zip(joker_ids, counts):
+            # -1 marks unlimited triggers
+            expected = triggers[joker_id.name]
+            assert count == (-1 if expected is None else expected)
 
 
 class TestMemoryEfficiency:
@@ -385,6 +466,9 @@ class TestMemoryEfficiency:
             assert metadata is not None
             assert metadata.name == metadata.name  # Should be consistent
 
+        # Repeated lookups share the same cached object
+        assert self.game.get_joker_metadata(joker_id) is metadata
+
 
 class TestBackwardCompatibility:
     """Test that existing joker API remains functional"""
@@ -1,6 +1,74 @@
 import pytest
 import pylatro
 import random
+from itertools import compress
+
+# One generator shared by the module's tests, reseeded per test so the
+# sequence of random draws is the same on every run
+_rng = random.Random()
+
+
+@pytest.fixture(autouse=True)
+def seed_rng(request):
+    _rng.seed(request.node.name)
+
+
+def legal_actions(game):
+    """Indices of the legal actions, filtered from the packed mask in C"""
+    space = game.gen_action_space_bytes()
+    return list(compress(range(len(space)), space))
+
+
+def random_legal_action(game):
+    """A uniformly random legal action index, or None if there is none.
+
+    Counts the legal entries and steps to the chosen one with bytes.index,
+    so no list of indices is built just to sample from it.
+    """
+    space = game.gen_action_space_bytes()
+    count = space.count(1)
+    if not count:
+        return None
+    index = space.index(1)
+    for _ in range(_rng.randrange(count)):
+        index = space.index(1, index + 1)
+    return index
+
+
+def buy_first_joker(game, max_moves=5000):
+    """Play random moves until the shop offers a joker, then buy it.
+    Returns False if the game ends first"""
+    for _ in range(max_moves):
+        for index in legal_actions(game):
+            if game.get_action_name(index).startswith("BuyJoker"):
+                game.handle_action_index(index)
+                return True
+        index = random_legal_action(game)
+        if index is None or game.handle_action_index(index):
+            return False
+    return False
+
+
+@pytest.fixture
+def game_with_joker():
+    # Enough hands that random play clears the first blind and reaches a shop
+    config = pylatro.Config()
+    config.plays = 50
+    game = pylatro.GameEngine(config)
+    assert buy_first_joker(game)
+    return game
+
+
+@pytest.fixture(scope="module")
+def shared_game():
+    return pylatro.GameEngine()
+
+
+@pytest.fixture
+def game(shared_game):
+    """One engine per module, reset before each test instead of rebuilt"""
+    shared_game.reset()
+    return shared_game
 
 
 def test_game_creation():
@@ -10,21 +78,66 @@ def test_game_creation():
     assert not game.is_over
     
 
-def test_game_state():
+def test_warmup():
+    """Test warmup leaves the shared caches built for every engine"""
+    pylatro.warmup()
+
+    first = pylatro.GameEngine().get_available_jokers()
+    second = pylatro.GameEngine().get_available_jokers()
+    assert first
+    # Definitions come from the metadata cache
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_game_state(game):
     """Test game state access"""
-    game = pylatro.GameEngine()
     state = game.state
     
     # Check state has expected attributes
-    assert hasattr(state, 'round')
-    assert hasattr(state, 'ante')
-    assert hasattr(state, 'money')
-    assert hasattr(state, 'score')
+    assert not {'round', 'ante', 'money', 'score'} - set(dir(state))
+
+    # The snapshot is shared until the game changes
+    assert game.state is state
+    game.handle_action_index(legal_actions(game)[0])
+    assert game.state is not state
     
 
-def test_action_space():
+def test_deck_bytes(game):
+    """Test the packed deck matches the card list"""
+    state = game.state
+    deck_bytes = state.deck_bytes
+
+    assert isinstance(deck_bytes, bytes)
+    assert len(deck_bytes) == len(state.deck)
+    # rank in the low nibble, suit in the high nibble
+    for byte, card in zip(deck_bytes, state.deck):
+        assert byte & 0x0F == int(card.value)
+        assert byte >> 4 == int(card.suit)
+
+
+def test_lightweight_state(game):
+    """Test lightweight state snapshot matches the full state"""
+    state = game.state
+    light = game.lightweight_state
+
+    assert light.money == state.money
+    assert light.score == state.score
+    assert light.round == state.round
+    assert light.plays_remaining == state.plays
+    assert light.discards_remaining == state.discards
+    assert light.stage == "PreBlind"
+
+
+def test_state_repr(game):
+    """Test GameState repr reports stage, round and score"""
+    state = game.state
+
+    assert repr(state).startswith("GameState: Stage=PreBlind, Round=")
+    assert f"Score={state.score:g}/" in repr(state)
+
+
+def test_action_space(game):
     """Test action space generation and basic gameplay"""
-    game = pylatro.GameEngine()
     
     # Play a few rounds
     moves = 0
@@ -40,20 +153,88 @@ def test_action_space():
         assert len(valid_actions) > 0, "Should have at least one valid action"
         
         # Execute a random valid action
-        action_idx = random.choice(valid_actions)
-        game.handle_action_index(action_idx)
+        action_idx = _rng.choice(valid_actions)
+        is_over = game.handle_action_index(action_idx)
+        assert is_over == game.is_over
         moves += 1
     
     assert game.is_over
     
 
-def test_action_names():
+def test_game_reset(game):
+    """Test an engine can be reset and played again"""
+    initial_money = game.state.money
+
+    while not game.is_over:
+        game.handle_action_index(random_legal_action(game))
+
+    game.reset()
+    assert not game.is_over
+    assert game.state.money == initial_money
+    assert game.state.score == 0
+    assert len(game.state.action_history) == 0
+
+
+def test_status(game):
+    """Test packed status flags agree with the separate properties"""
+    status = game.status()
+    assert bool(status & 1) == game.is_over
+    assert bool(status & 2) == game.is_win
+    assert status >> 2 == game.state.stage.int()
+
+    game.play_until_done()
+    status = game.status()
+    assert status & 1
+    assert bool(status & 2) == game.is_win
+
+
+def test_step(game):
+    """Test step applies the action and returns the next status and mask"""
+    index = legal_actions(game)[0]
+    is_over, is_win, mask = game.step(index)
+
+    assert is_over == game.is_over
+    assert is_win == game.is_win
+    assert mask == game.gen_action_space_bytes()
+
+
+def test_action_space_bytes(game):
+    """Test packed action space matches the list form"""
+
+    mask = game.gen_action_space_bytes()
+    assert isinstance(mask, bytes)
+    assert list(mask) == game.gen_action_space()
+
+
+def test_obs_vector(game):
+    """Test observation vector agrees with game state"""
+    state = game.state
+
+    obs = game.obs_vector()
+    assert len(obs) == 12
+    assert obs[0] == state.score
+    assert obs[6] == state.money
+    assert obs[7] == len(state.deck)
+    assert obs[9] == len(state.available)
+
+
+def test_cached_actions(game):
+    """Test cached actions are refreshed after the game changes"""
+
+    actions = game.get_cached_actions()
+    assert len(actions) == len(game.gen_actions())
+    assert game.get_cached_actions() is actions
+
+    valid_actions = legal_actions(game)
+    game.handle_action_index(valid_actions[0])
+    assert len(game.get_cached_actions()) == len(game.gen_actions())
+
+
+def test_action_names(game):
     """Test action name generation"""
-    game = pylatro.GameEngine()
     
     # Get some actions
-    action_space = game.gen_action_space()
-    valid_actions = [i for i, valid in enumerate(action_space) if valid == 1]
+    valid_actions = legal_actions(game)
     
     if valid_actions:
         action_idx = valid_actions[0]
@@ -61,38 +242,44 @@ def test_action_names():
         assert isinstance(action_name, str)
         assert len(action_name) > 0
 
+        # Names are reused until the game changes
+        assert game.get_action_name(action_idx) is action_name
+
 
-def test_game_completion():
+def test_game_completion(game):
     """Test that games can complete with win or loss"""
-    game = pylatro.GameEngine()
     
-    # Play until game over
-    while not game.is_over:
-        action_space = game.gen_action_space()
-        valid_actions = [i for i, valid in enumerate(action_space) if valid == 1]
-        if not valid_actions:
-            break
-        action_idx = random.choice(valid_actions)
-        game.handle_action_index(action_idx)
+    # Play until game over, each random move is chosen inside the engine
+    seed = 0
+    while not game.step_random(seed):
+        seed += 1
     
     assert game.is_over
     # Game should either be won or lost
     assert hasattr(game, 'is_win')
 
 
-def test_multiple_games():
+def test_play_until_done(game):
+    """Test playing out a whole game in one call"""
+
+    is_over, is_win, moves = game.play_until_done(seed=7)
+    assert is_over and game.is_over
+    assert is_win == game.is_win
+    assert moves == len(game.state.action_history)
+
+
+def test_multiple_games(game):
     """Test running multiple games to ensure stability"""
+    # One engine is reset between games rather than constructing five
     for _ in range(5):
-        game = pylatro.GameEngine()
+        game.reset()
         moves = 0
         max_moves = 500
         
         while not game.is_over and moves < max_moves:
-            action_space = game.gen_action_space()
-            valid_actions = [i for i, valid in enumerate(action_space) if valid == 1]
-            if not valid_actions:
+            action_idx = random_legal_action(game)
+            if action_idx is None:
                 break
-            action_idx = random.choice(valid_actions)
             game.handle_action_index(action_idx)
             moves += 1
         
@@ -112,11 +299,32 @@ def test_joker_id_types():
     assert hasattr(rarity, 'Uncommon') 
     assert hasattr(rarity, 'Rare')
     assert hasattr(rarity, 'Legendary')
+    assert int(rarity.Common) == 0
+    assert rarity.Legendary == 3
+
+    # JokerId is hashable and exposes its name
+    joker_id = pylatro.JokerId.GreedyJoker
+    assert joker_id.name == 'GreedyJoker'
+    assert {joker_id: 1}[pylatro.JokerId.GreedyJoker] == 1
+    assert joker_id != pylatro.JokerId.Joker
+    assert len({joker_id, pylatro.JokerId.GreedyJoker, pylatro.JokerId.Joker}) == 2
+    assert joker_id != 'GreedyJoker'
+
+
+def test_joker_id_codes(game_with_joker):
+    """joker_id_codes holds the discriminant of each joker id, in order"""
+    state = game_with_joker.state
+    joker_ids = state.joker_ids
+    codes = state.joker_id_codes
+    assert joker_ids
+    assert codes.typecode == 'H'
+    assert len(codes) == len(joker_ids)
+    for code, joker_id in zip(codes, joker_ids):
+        assert code == int(joker_id)
 
 
-def test_gamestate_joker_ids():
+def test_gamestate_joker_ids(game):
     """Test GameState joker_ids property"""
-    game = pylatro.GameEngine()
     state = game.state
     
     # Test new joker_ids property
@@ -132,10 +340,21 @@ def test_gamestate_joker_ids():
     # Both lists should have same length (same jokers, different representations)
     assert len(joker_ids) == len(old_jokers)
 
+    # Each read builds a new list of the shared JokerId objects
+    assert state.joker_ids is not joker_ids
+    assert state.joker_ids == joker_ids
 
-def test_gamestate_joker_slots():
+    # The tuple form is built once per state and shared between reads
+    joker_ids_tuple = state.joker_ids_tuple
+    if not joker_ids:
+        assert joker_ids_tuple == ()
+    assert isinstance(joker_ids_tuple, tuple)
+    assert state.joker_ids_tuple is joker_ids_tuple
+    assert list(joker_ids_tuple) == joker_ids
+
+
+def test_gamestate_joker_slots(game):
     """Test GameState joker slot methods"""
-    game = pylatro.GameEngine()
     state = game.state
     
     # Test joker slot properties
@@ -152,9 +371,21 @@ def test_gamestate_joker_slots():
     assert slots_used <= slots_total
 
 
-def test_gameengine_joker_registry():
+def test_gamestate_snapshot(game):
+    """Test GameState.snapshot matches the individual joker getters"""
+    state = game.state
+
+    with pytest.warns(DeprecationWarning):
+        joker_ids, jokers, slots_used, slots_total = state.snapshot()
+
+    assert joker_ids == state.joker_ids
+    assert len(jokers) == len(joker_ids)
+    assert slots_used == state.joker_slots_used
+    assert slots_total == state.joker_slots_total
+
+
+def test_gameengine_joker_registry(game):
     """Test GameEngine joker registry methods"""
-    game = pylatro.GameEngine()
     
     # Test get_available_jokers
     assert hasattr(game, 'get_available_jokers')
@@ -164,6 +395,16 @@ def test_gameengine_joker_registry():
     # Test filtering by rarity
     common_jokers = game.get_available_jokers(pylatro.JokerRarity.Common)
     assert isinstance(common_jokers, list)
+
+    # Rarity lists are copied from prebuilt tuples, a new list each call
+    # holding the same definition objects as the full list
+    assert game.get_available_jokers(pylatro.JokerRarity.Common) is not common_jokers
+    by_id = {joker.id: joker for joker in all_jokers}
+    assert all(by_id[joker.id] is joker for joker in common_jokers)
+    assert all(joker.rarity == pylatro.JokerRarity.Common for joker in common_jokers)
+    # Definitions are shared between calls, the lists are not
+    assert game.get_available_jokers() is not all_jokers
+    assert all(a is b for a, b in zip(game.get_available_jokers(), all_jokers))
     
     # Test get_joker_info 
     assert hasattr(game, 'get_joker_info')
@@ -175,9 +416,8 @@ def test_gameengine_joker_registry():
     assert hasattr(game, 'get_joker_cost')
 
 
-def test_joker_definition_properties():
+def test_joker_definition_properties(game):
     """Test JokerDefinition properties"""
-    game = pylatro.GameEngine()
     
     # Get some joker definitions
     jokers = game.get_available_jokers()
@@ -186,11 +426,10 @@ def test_joker_definition_properties():
         joker_def = jokers[0]
         
         # Test that JokerDefinition has expected properties
-        assert hasattr(joker_def, 'id')
-        assert hasattr(joker_def, 'name')
-        assert hasattr(joker_def, 'description')
-        assert hasattr(joker_def, 'rarity')
-        assert hasattr(joker_def, 'unlock_condition')
+        missing = {
+            'id', 'name', 'description', 'rarity', 'unlock_condition',
+        } - set(dir(joker_def))
+        assert not missing
         
         # Test property types
         assert isinstance(joker_def.name, str)
@@ -203,9 +442,8 @@ def test_joker_definition_properties():
         ]
 
 
-def test_joker_cost_validation():
+def test_joker_cost_validation(game):
     """Test joker cost and affordability validation"""
-    game = pylatro.GameEngine()
     
     # Get some jokers to test with
     jokers = game.get_available_jokers()
@@ -228,41 +466,30 @@ def test_joker_cost_validation():
         assert isinstance(can_buy, bool)
 
 
-def test_backward_compatibility():
+def test_backward_compatibility(game):
     """Test that existing Python code continues to work"""
-    game = pylatro.GameEngine()
     state = game.state
     
-    # All existing properties should still be available
-    assert hasattr(state, 'stage')
-    assert hasattr(state, 'round')
-    assert hasattr(state, 'action_history')
-    assert hasattr(state, 'deck')
-    assert hasattr(state, 'selected')
-    assert hasattr(state, 'available')
-    assert hasattr(state, 'discarded')
-    assert hasattr(state, 'plays')
-    assert hasattr(state, 'discards')
-    assert hasattr(state, 'score')
-    assert hasattr(state, 'required_score')
-    assert hasattr(state, 'jokers')  # Old jokers method
-    assert hasattr(state, 'money')
-    assert hasattr(state, 'ante')
+    # All existing properties should still be available. dir() lists them
+    # without running each getter the way hasattr does
+    missing = {
+        'stage', 'round', 'action_history', 'deck', 'selected', 'available',
+        'discarded', 'plays', 'discards', 'score', 'required_score',
+        'jokers',  # Old jokers method
+        'money', 'ante',
+    } - set(dir(state))
+    assert not missing
     
     # All existing GameEngine methods should still work
-    assert hasattr(game, 'gen_actions')
-    assert hasattr(game, 'gen_action_space')
-    assert hasattr(game, 'handle_action')
-    assert hasattr(game, 'handle_action_index')
-    assert hasattr(game, 'get_action_name')
-    assert hasattr(game, 'state')
-    assert hasattr(game, 'is_over')
-    assert hasattr(game, 'is_win')
+    missing = {
+        'gen_actions', 'gen_action_space', 'handle_action', 'handle_action_index',
+        'get_action_name', 'state', 'is_over', 'is_win',
+    } - set(dir(game))
+    assert not missing
 
 
-def test_new_and_old_joker_consistency():
+def test_new_and_old_joker_consistency(game):
     """Test that new joker_ids and old jokers have consistent data"""
-    game = pylatro.GameEngine()
     state = game.state
     
     old_jokers = state.jokers
@@ -271,11 +498,11 @@ def test_new_and_old_joker_consistency():
     # Should have same number of jokers
     assert len(old_jokers) == len(new_joker_ids)
     
-    # If we have jokers, test the conversion works
-    for i, (old_joker, new_id) in enumerate(zip(old_jokers, new_joker_ids)):
-        # The old joker should be convertible to the same JokerId
-        # This tests that the to_joker_id() method works correctly
-        converted_id = old_joker.to_joker_id()
+    # If we have jokers, test the conversion works. The old jokers are
+    # converted to JokerIds in one call rather than to_joker_id() per joker
+    converted_ids = state.legacy_joker_ids()
+    assert len(converted_ids) == len(old_jokers)
+    for converted_id, new_id in zip(converted_ids, new_joker_ids):
         assert converted_id == new_id
 
 